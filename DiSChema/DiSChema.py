@@ -1,38 +1,459 @@
-import copy
 from .exceptions import *
-from .properties import restrictions, types
+from . import exceptions as _exceptions
+from .properties import restrictions, types, transformations, type_families, binary_types
+
+# API pública de 'from DiSChema import *': el validador y sus excepciones, no los
+# módulos ni las tablas internas (copy, restrictions, types...)
+__all__ = ['DiSchema', *(name for name in vars(_exceptions) if name.endswith('Error'))]
+
+# Los módulos de reglas opcionales (formats, limits, uniqueness, projection) y 'copy'
+# se importan solo cuando un esquema o una llamada los necesita, para que importar
+# el paquete sea ligero
+
+# Valores inmutables: la copia profunda los devuelve tal cual
+_atomic_types = frozenset((str, int, float, bool, complex, type(None)))
+
+def _is_binary(value) -> bool:
+    """Buffers binarios; mmap se reconoce por nombre para no importar el módulo"""
+    return isinstance(value, binary_types) or type(value).__name__ == 'mmap'
+
+def _copy_data(value, memo: dict = None, budget=None):
+    """Copia profunda de los datos que comparte (no copia) los buffers binarios
+
+    Con un presupuesto activo la copia también lo consume: cada dict o lista
+    copiado cuenta como nodo y las listas se miden antes de recorrerlas.
+    """
+    if type(value) in _atomic_types:
+        return value
+
+    if memo is None:
+        memo = {}
+
+    value_id = id(value)
+    if value_id in memo:
+        return memo[value_id]
+
+    if type(value) is dict:
+        if budget is not None:
+            budget.visit()
+        result = memo[value_id] = {}
+        for key, item in value.items():
+            result[key] = _copy_data(item, memo, budget)
+        return result
+
+    if type(value) is list:
+        if budget is not None:
+            budget.items(len(value))
+            budget.visit()
+        result = memo[value_id] = []
+        for item in value:
+            result.append(_copy_data(item, memo, budget))
+        return result
+
+    if _is_binary(value):
+        return value
+
+    import copy
+    return copy.deepcopy(value, memo)
 
 class DiSchema:
-    def __init__(self, scheme: dict, stop: bool = False) -> None:
+    restrictions = restrictions
+
+    # Valores por defecto a nivel de clase: los artefactos solo guardan lo que difiere
+    stop = False
+    limits = None
+    _nesting_level = 0
+    _max_nesting = 100
+    _projection = None
+
+    def __init__(self, scheme: dict, stop: bool = False, limits: dict = None) -> None:
         self.scheme = scheme
-        self.restrictions = restrictions
         self.stop = stop
         self.errors = []
         self._nesting_level = 0  # Control de profundidad para evitar recursión infinita
         self._max_nesting = 100  # Límite máximo de anidación
+        if limits is not None:
+            from .limits import validate_limits
+            limits = validate_limits(limits)
+        self.limits = limits  # Límites de recursos por llamada a check()
+        self._budget = None  # Presupuesto activo, compartido con los sub-validadores
+        self._projection = None  # Árboles (only, exclude) de un validador proyectado
+        self._projections = {}  # Caché de validadores proyectados por rutas
+
+        # Esquema normalizado: conjuntos precalculados, tipos resueltos y sub-validadores
+        self._prepared = self._prepare_scheme(scheme)
+
+    @property
+    def scheme(self) -> dict:
+        """Esquema original; en validadores cargados de un artefacto se reconstruye del preparado"""
+        scheme = self.__dict__.get('_scheme')
+        if scheme is None and isinstance(self._prepared, dict):
+            scheme = self._scheme = {
+                field: {key: value for key, value in field_scheme.items() if not key.startswith('_')}
+                if isinstance(field_scheme, dict) else field_scheme
+                for field, field_scheme in self._prepared.items()
+            }
+        return scheme
+
+    @scheme.setter
+    def scheme(self, scheme: dict) -> None:
+        self._scheme = scheme
+
+    @property
+    def selectors(self) -> dict:
+        """Asocia cada tipo con su método de validación (se crea al primer uso)"""
+        selectors = self.__dict__.get('_selectors')
+        if selectors is None:
+            selectors = self._selectors = {
+                'str': self.strings,
+                'int': self.numbers,
+                'float': self.numbers,
+                'list': self.lists,
+                'bool': self.booleans,
+                'dict': self.dicts,
+                'bytes': self.binaries,
+                'bytearray': self.binaries,
+                'memoryview': self.binaries,
+                'mmap': self.binaries
+            }
+        return selectors
+
+    def __getstate__(self) -> dict:
+        """Estado serializable: solo el esquema preparado y la configuración
+
+        El esquema original no se guarda (está contenido en el preparado), ni
+        los métodos enlazados, los errores, las cachés o los valores por defecto.
+        """
+        transient = ('_scheme', '_selectors', 'errors', '_budget', '_projections')
+        cls = type(self)
+        return {
+            key: value for key, value in self.__dict__.items()
+            if key not in transient and not (hasattr(cls, key) and getattr(cls, key) == value)
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        """Restaura un validador preparado sin volver a procesar el esquema"""
+        self.__dict__.update(state)
+        self.errors = []
+        self._budget = None
+        self._projections = {}
+
+    def save(self, path) -> None:
+        """Guarda el validador preparado como artefacto versionado en disco"""
+        from .artifacts import dump_artifact
+        dump_artifact(self, path)
+
+    @classmethod
+    def load(cls, path) -> 'DiSchema':
+        """Carga un validador preparado desde un artefacto en disco
+
+        Advertencia: el artefacto se deserializa con pickle, que puede ejecutar
+        código arbitrario. Cargue solo artefactos generados por usted mismo.
+        """
+        from .artifacts import load_artifact
+        return load_artifact(path)
+
+    def summarize(self, records, start: int = 0, examples: int = 5):
+        """Valida un lote acumulando solo contadores por (ruta, regla), sin objetos de error"""
+        from .summary import ValidationSummary
+        return ValidationSummary(self, examples=examples).consume(records, start)
+
+    def _prepare_scheme(self, scheme: dict) -> dict:
+        """Normaliza el esquema completo una sola vez"""
+        if not isinstance(scheme, dict):
+            return scheme
 
-        self.selectors = {
-            'str': self.strings,
-            'int': self.numbers,
-            'float': self.numbers,
-            'list': self.lists,
-            'bool': self.booleans,
-            'dict': self.dicts
+        return {
+            field: self._prepare_field(field_scheme)
+            for field, field_scheme in scheme.items()
         }
+
+    def _prepare_field(self, scheme: dict) -> dict:
+        """Normaliza el esquema de un campo: claves privadas con valores precalculados"""
+        if not isinstance(scheme, dict):
+            return scheme
+
+        prepared = dict(scheme)
+        prepared['_type'] = transformations.get(scheme.get('type'), types.get(scheme.get('type')))
+
+        if isinstance(scheme.get('allowed-chars'), list):
+            prepared['_allowed-chars'] = frozenset(scheme['allowed-chars'])
+
+        # Reglas binarias: prefijos normalizados y clase de bytes prohibidos compilada
+        if scheme.get('type') == 'bytes':
+            prefixes = self._magic_prefixes(scheme.get('magic-prefix'))
+            if prefixes is not None:
+                prepared['_magic-prefix'] = prefixes
+
+            forbidden = self._forbidden_bytes_pattern(scheme.get('allowed-bytes'))
+            if forbidden is not None:
+                prepared['_allowed-bytes'] = forbidden
+
+        # Expresiones regulares compiladas una vez y compartidas por la caché del proceso
+        # Un patrón inválido no se compila aquí: se notifica en check() como las demás reglas mal formadas
+        if isinstance(scheme.get('pattern'), str):
+            from .formats import compile_pattern
+            import re
+            try:
+                prepared['_pattern'] = compile_pattern(scheme['pattern'])
+            except re.error:
+                pass
+
+        if isinstance(scheme.get('format'), str):
+            from .formats import formats
+            if scheme['format'] in formats:
+                prepared['_format'] = formats[scheme['format']]
+
+        # 'excluded-chars' admite subcadenas: el conjunto solo sirve si son caracteres sueltos
+        excluded_chars = scheme.get('excluded-chars')
+        if isinstance(excluded_chars, list) and all(isinstance(c, str) and len(c) == 1 for c in excluded_chars):
+            prepared['_excluded-chars'] = frozenset(excluded_chars)
+
+        for rule in ('allowed-equalities', 'excluded-equalities'):
+            values = scheme.get(rule)
+            if isinstance(values, (list, tuple, set, frozenset)):
+                try:
+                    prepared[f'_{rule}'] = frozenset(values)
+                except TypeError:
+                    pass  # Valores no hashables: se mantiene la búsqueda lineal
+
+        # Sub-validadores para estructuras anidadas
+        if isinstance(scheme.get('schema'), dict):
+            prepared['_schema-validator'] = self._build_sub_validator(scheme['schema'])
+
+        if isinstance(scheme.get('allowed-items'), list):
+            prepared['_allowed-validators'] = [
+                self._build_sub_validator(allowed_schema) if isinstance(allowed_schema, dict) else None
+                for allowed_schema in scheme['allowed-items']
+            ]
+
+        return prepared
+
+    def _build_sub_validator(self, schema: dict) -> 'DiSchema':
+        """Crea el sub-validador de una estructura anidada"""
+        if 'type' in schema:
+            # Es un esquema de campo simple
+            return DiSchema({"nested_field": schema}, stop=False)
+        # Es un esquema completo (dict con múltiples campos)
+        return DiSchema(schema, stop=False)
     
-    def check(self, data: dict) -> dict:
-        """Valida los datos según el esquema definido"""
+    @staticmethod
+    def _matches_type(value, expected_type: str) -> bool:
+        """Comprueba el tipo de un valor teniendo en cuenta las familias de tipos"""
+        current_type = type(value).__name__
+        return current_type == expected_type or current_type in type_families.get(expected_type, ())
+
+    @staticmethod
+    def _magic_prefixes(prefix) -> tuple | None:
+        """Normaliza 'magic-prefix' a una tupla de bytes"""
+        if _is_binary(prefix):
+            return (bytes(prefix),)
+        if isinstance(prefix, (list, tuple)) and all(_is_binary(item) for item in prefix):
+            return tuple(bytes(item) for item in prefix)
+        return None
+
+    @staticmethod
+    def _forbidden_bytes_pattern(allowed_bytes):
+        """Compila una clase regex con los bytes NO permitidos (búsqueda sin copiar el buffer)"""
+        import re
+        from .formats import compile_pattern
+
+        if _is_binary(allowed_bytes):
+            allowed = set(bytes(allowed_bytes))
+        elif isinstance(allowed_bytes, (list, tuple, set, frozenset)) and \
+                all(isinstance(byte, int) and 0 <= byte <= 255 for byte in allowed_bytes):
+            allowed = set(allowed_bytes)
+        else:
+            return None
+
+        if not allowed:
+            return compile_pattern(b'(?s).')
+        escaped = b''.join(re.escape(bytes([byte])) for byte in sorted(allowed))
+        return compile_pattern(b'[^' + escaped + b']')
+
+    def _projected(self, only, exclude) -> 'DiSchema':
+        """Validador reducido a las rutas seleccionadas (cacheado por combinación de rutas)"""
+        from .projection import path_tree, validate_paths, PROJECTION_CACHE_SIZE
+        key = (tuple([only] if isinstance(only, str) else only or ()),
+               tuple([exclude] if isinstance(exclude, str) else exclude or ()))
+        projected = self._projections.get(key)
+        if projected is None:
+            only_tree, exclude_tree = path_tree(key[0]), path_tree(key[1])
+            validate_paths(only_tree, self.scheme)
+            validate_paths(exclude_tree, self.scheme)
+
+            projected = self._project_tree(only_tree, exclude_tree)
+            if len(self._projections) >= PROJECTION_CACHE_SIZE:
+                del self._projections[next(iter(self._projections))]
+            self._projections[key] = projected
+        return projected
+
+    def _project_tree(self, only: dict | None, exclude: dict | None) -> 'DiSchema':
+        """Copia del validador cuyo esquema preparado solo contiene las rutas seleccionadas"""
+        import copy
+        from .projection import SKIP, select_only, select_exclude
+        projected = copy.copy(self)
+        projected._projection = (only, exclude)
+        projected.errors = []
+        projected._projections = {}
+
+        prepared = {}
+        for field, scheme in self._prepared.items():
+            field_only = select_only(only, field)
+            field_exclude = select_exclude(exclude, field)
+            if field_only is SKIP or field_exclude is SKIP:
+                continue
+
+            if field_only is None and field_exclude is None:
+                prepared[field] = scheme
+            else:
+                prepared[field] = self._project_field(scheme, field_only, field_exclude)
+
+        projected._prepared = prepared
+        return projected
+
+    def _project_field(self, scheme: dict, only: dict | None, exclude: dict | None) -> dict:
+        """Mantiene las reglas propias del campo y proyecta sus estructuras anidadas"""
+        from .projection import SKIP, LIST_WILDCARD, DICT_WILDCARD, select_only, select_exclude
+        if not isinstance(scheme, dict):
+            return scheme
+
+        # Los sub-validadores de esquemas de campo simple validan {'nested_field': valor}
+        def nested(tree, schema):
+            if tree is None or 'type' not in schema:
+                return tree
+            return {'nested_field': tree}
+
+        projected = dict(scheme)
+
+        sub_validator = scheme.get('_schema-validator')
+        if sub_validator is not None:
+            projected['_schema-validator'] = sub_validator._project_tree(
+                nested(only, scheme['schema']), nested(exclude, scheme['schema'])
+            )
+
+        sub_validators = scheme.get('_allowed-validators')
+        if sub_validators is not None:
+            wildcard = LIST_WILDCARD if scheme.get('type') == 'list' else DICT_WILDCARD
+            items_only = select_only(only, wildcard)
+            items_exclude = select_exclude(exclude, wildcard)
+
+            if items_only is SKIP or items_exclude is SKIP:
+                # Elementos no seleccionados: no se recorren
+                projected.pop('allowed-items', None)
+                projected.pop('_allowed-validators', None)
+            elif items_only is not None or items_exclude is not None:
+                projected['_allowed-validators'] = [
+                    sub_validator._project_tree(nested(items_only, allowed_schema), nested(items_exclude, allowed_schema))
+                    if sub_validator is not None else None
+                    for allowed_schema, sub_validator in zip(scheme['allowed-items'], sub_validators)
+                ]
+
+        return projected
+
+    def check(self, data: dict, only: list = None, exclude: list = None) -> dict:
+        """Valida los datos según el esquema definido
+
+        'only' y 'exclude' limitan la validación a rutas como 'users[*].name'
+        ('[*]' para elementos de listas, '*' para valores de diccionarios).
+        """
+        if only or exclude:
+            return self._projected(only, exclude).check(data)
+        return self._check(data)
+
+    def _check(self, data: dict, unique_indexes: dict = None) -> dict:
+        """Valida un registro; 'unique_indexes' son los índices de 'unique' de check_batch()"""
         self.errors.clear()
         self._nesting_level = 0
 
-        # Usar deep copy para evitar mutaciones accidentales
-        processed_data = {
-            'original': data,
-            'copy': copy.deepcopy(data)
+        # Solo la llamada raíz crea el presupuesto; las anidadas lo heredan
+        owns_budget = self._budget is None and self.limits is not None
+        if owns_budget:
+            from .limits import ValidationBudget
+            self._budget = ValidationBudget(self.limits)
+
+        processed_data = {'original': data, 'copy': data}
+        try:
+            # Usar deep copy para evitar mutaciones accidentales (los buffers binarios no se copian)
+            budget = self._budget
+            if self._projection is None:
+                processed_data['copy'] = _copy_data(data, budget=budget)
+            else:
+                from .projection import project_copy
+                processed_data['copy'] = project_copy(
+                    data, *self._projection, lambda value: _copy_data(value, budget=budget)
+                )
+            return self._check_fields(processed_data, unique_indexes)
+        except ValidationBudgetExceededError as error:
+            if not owns_budget:
+                raise
+            # Terminar la validación de inmediato con el error dedicado
+            self.errors.append(error)
+            return self._create_response(processed_data, self.errors)
+        finally:
+            if owns_budget:
+                self._budget = None
+
+    def check_batch(self, records, unique: str = 'exact', capacity: int = 1_000_000, error_rate: float = 0.001):
+        """Valida un lote o flujo de registros aplicando 'unique' entre ellos
+
+        'unique' elige el índice: 'exact' (resúmenes de claves) o 'bloom'
+        (memoria acotada según 'capacity' y tasa de falsos positivos 'error_rate').
+        """
+        indexes = self._unique_indexes(unique, capacity, error_rate)
+        for record in records:
+            yield self._batch_result(record, indexes)
+
+    def check_ndjson(self, source, **options):
+        """Valida un fichero (ruta u objeto) NDJSON línea a línea como check_batch()
+
+        Una línea con JSON inválido se entrega como resultado inválido y se continúa.
+        """
+        import json
+
+        def results(file):
+            indexes = self._unique_indexes(**options)
+            for number, line in enumerate(file, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError as error:
+                    error = Exception(f"JSON inválido en la línea {number}: {error}")
+                    yield {'data': {'original': line, 'copy': line}, 'errors': [error], 'valid': False}
+                    continue
+                yield self._batch_result(record, indexes)
+
+        if hasattr(source, 'read'):
+            yield from results(source)
+            return
+
+        with open(source, encoding='utf-8') as file:
+            yield from results(file)
+
+    def _unique_indexes(self, unique: str = 'exact', capacity: int = 1_000_000, error_rate: float = 0.001) -> dict:
+        """Un índice por campo con 'unique', propio de cada lote (nunca se guarda en el validador)"""
+        from .uniqueness import make_index
+        return {
+            field: make_index(unique, capacity, error_rate)
+            for field, scheme in self._prepared.items()
+            if isinstance(scheme, dict) and scheme.get(restrictions['fields']['unique'])
         }
 
-        for field, scheme in self.scheme.items():
+    def _batch_result(self, record, indexes: dict) -> dict:
+        result = self._check(record, indexes)
+        # La lista de errores se reutiliza en cada check(): entregar una copia
+        return {**result, 'errors': list(result['errors'])}
+
+    def _check_fields(self, processed_data: dict, unique_indexes: dict = None) -> dict:
+        """Recorre los campos del esquema preparado"""
+        budget = self._budget
+
+        for field, scheme in self._prepared.items():
             try:
+                if budget is not None:
+                    budget.visit(field)
+
                 # Paso 1: Procesar campo (verificar existencia, valores por defecto)
                 result = self._process_field(field, processed_data['copy'], scheme)
                 if isinstance(result, Exception):
@@ -43,6 +464,10 @@ class DiSchema:
                 
                 processed_data['copy'] = result
 
+                # Campo opcional ausente y sin valor por defecto: no hay nada que validar
+                if field not in result:
+                    continue
+
                 # Paso 2: Transformar tipo si es necesario y está permitido
                 if self._needs_transformation(field, processed_data['copy'], scheme):
                     result = self._transform_field(field, processed_data['copy'], scheme)
@@ -73,6 +498,17 @@ class DiSchema:
                         self.errors.append(result)
                         continue
 
+                # Paso 5: Unicidad entre registros del mismo lote o flujo
+                if unique_indexes is not None and field in unique_indexes:
+                    if unique_indexes[field].add(field_value):
+                        error = DuplicateValueError(field_value, field)
+                        if self._should_stop_on_error(scheme, error):
+                            return self._create_error_response(processed_data, error)
+                        self.errors.append(error)
+                        continue
+
+            except ValidationBudgetExceededError:
+                raise
             except Exception as e:
                 # Capturar errores inesperados
                 error = Exception(f"Error inesperado procesando campo '{field}': {str(e)}")
@@ -115,11 +551,10 @@ class DiSchema:
         if field not in data:
             return False
         
-        current_type = type(data[field]).__name__
         expected_type = scheme['type']
         has_transformation = restrictions['fields']['try-transformation'] in scheme and scheme['try-transformation']
         
-        return current_type != expected_type and has_transformation
+        return not self._matches_type(data[field], expected_type) and has_transformation
 
     def _transform_field(self, field: str, data: dict, scheme: dict) -> dict | Exception:
         """Transforma el tipo de un campo"""
@@ -138,7 +573,8 @@ class DiSchema:
             if original_value is None and expected_type != 'NoneType':
                 return InvalidTypeError(field, expected_type)
             
-            data[field] = types[expected_type](original_value)
+            convert = scheme.get('_type') or transformations.get(expected_type, types[expected_type])
+            data[field] = convert(original_value)
             return data
         except (ValueError, TypeError) as e:
             return InvalidTypeError(field, expected_type)
@@ -148,10 +584,7 @@ class DiSchema:
         if field not in data:
             return True  # Campo no existe, no validar tipo
         
-        current_type = type(data[field]).__name__
-        expected_type = scheme['type']
-        
-        return current_type == expected_type
+        return self._matches_type(data[field], scheme['type'])
 
     def _should_stop_on_error(self, scheme: dict, error: Exception) -> bool:
         """Determina si se debe detener el procesamiento en caso de error"""
@@ -177,7 +610,7 @@ class DiSchema:
             'valid': valid
         }
 
-    def _validate_nested_structure(self, data, schema, field_path: str = "") -> list:
+    def _validate_nested_structure(self, data, schema, field_path: str = "", sub_validator: 'DiSchema' = None) -> list:
         """Valida estructuras anidadas recursivamente"""
         nested_errors = []
         
@@ -189,10 +622,13 @@ class DiSchema:
             return nested_errors
 
         try:
-            # Crear un sub-validador para la estructura anidada
+            # Reutilizar el sub-validador preparado o crear uno nuevo
+            if isinstance(schema, dict):
+                sub_validator = sub_validator or self._build_sub_validator(schema)
+                sub_validator._budget = self._budget
+
             if isinstance(schema, dict) and 'type' in schema:
                 # Es un esquema de campo simple
-                sub_validator = DiSchema({"nested_field": schema}, stop=False)
                 result = sub_validator.check({"nested_field": data})
                 
                 if not result['valid']:
@@ -203,7 +639,6 @@ class DiSchema:
             
             elif isinstance(schema, dict):
                 # Es un esquema completo (dict con múltiples campos)
-                sub_validator = DiSchema(schema, stop=False)
                 result = sub_validator.check(data)
                 
                 if not result['valid']:
@@ -212,11 +647,15 @@ class DiSchema:
                         error_msg = f"{field_path}.{str(error)}"
                         nested_errors.append(Exception(error_msg))
         
+        except ValidationBudgetExceededError:
+            raise
         except Exception as e:
             nested_errors.append(Exception(f"Error validando estructura anidada en '{field_path}': {str(e)}"))
         
         finally:
             self._nesting_level -= 1
+            if sub_validator is not None:
+                sub_validator._budget = None
         
         return nested_errors
 
@@ -230,12 +669,12 @@ class DiSchema:
                 return NoEqualError(field, scheme['equal'])
         
         if restrictions['number']['excluded-equalities'] in scheme:
-            if field in scheme['excluded-equalities']:
-                return Exception(f"Valor {field} está en la lista de valores excluidos en '{field_path}'")
+            if field in scheme.get('_excluded-equalities', scheme['excluded-equalities']):
+                return ExcludedValueError(field, field_path)
         
         if restrictions['number']['allowed-equalities'] in scheme:
-            if field not in scheme['allowed-equalities']:
-                return Exception(f"Valor {field} no está en la lista de valores permitidos en '{field_path}'")
+            if field not in scheme.get('_allowed-equalities', scheme['allowed-equalities']):
+                return NotAllowedValueError(field, field_path)
                     
         if restrictions['number']['max-size'] in scheme:
             if field > scheme['max-size']:
@@ -251,36 +690,72 @@ class DiSchema:
         """Validaciones específicas para strings"""
         if field is None:
             return Exception(f"String no puede ser None en '{field_path}'")
+
+        if self._budget is not None:
+            self._budget.text(field, field_path)
         
         if restrictions['str']['excluded-chars'] in scheme:
             excluded_chars = scheme['excluded-chars']
             if not isinstance(excluded_chars, list):
                 return Exception(f"'excluded-chars' debe ser una lista en '{field_path}'")
             
-            for char in excluded_chars:
-                if char in field:
+            excluded_set = scheme.get('_excluded-chars')
+            if excluded_set is not None:
+                # Conjunto precalculado: una sola intersección en C
+                if not excluded_set.isdisjoint(field):
                     return ExcludedCharactersError(field)
+            else:
+                for char in excluded_chars:
+                    if char in field:
+                        return ExcludedCharactersError(field)
         
         if restrictions['str']['allowed-chars'] in scheme:
             allowed_chars = scheme['allowed-chars']
             if not isinstance(allowed_chars, list):
                 return Exception(f"'allowed-chars' debe ser una lista en '{field_path}'")
             
+            allowed_set = scheme.get('_allowed-chars') or frozenset(allowed_chars)
             for char in field:
-                if char not in allowed_chars:
-                    return Exception(f"Carácter '{char}' no está permitido en '{field_path}'")
+                if char not in allowed_set:
+                    return NotAllowedCharacterError(char, field_path)
+
+        if restrictions['str']['pattern'] in scheme:
+            pattern = scheme.get('_pattern')
+            if pattern is None:
+                if not isinstance(scheme['pattern'], str):
+                    return Exception(f"'pattern' debe ser una cadena en '{field_path}'")
+                from .formats import compile_pattern
+                import re
+                try:
+                    pattern = compile_pattern(scheme['pattern'])
+                except re.error as error:
+                    return Exception(f"'pattern' inválido en '{field_path}': {error}")
+
+            if pattern.fullmatch(field) is None:
+                return PatternMismatchError(field, scheme['pattern'], field_path)
+
+        if restrictions['str']['format'] in scheme:
+            checker = scheme.get('_format')
+            if checker is None and isinstance(scheme['format'], str):
+                from .formats import formats
+                checker = formats.get(scheme['format'])
+            if checker is None:
+                return Exception(f"Formato '{scheme['format']}' no soportado en '{field_path}'")
+
+            if not checker(field):
+                return InvalidFormatError(field, scheme['format'], field_path)
                         
         if restrictions['str']['equal'] in scheme:
             if field != scheme['equal']:
                 return NoEqualError(field, scheme['equal'])
         
         if restrictions['str']['excluded-equalities'] in scheme:
-            if field in scheme['excluded-equalities']:
-                return Exception(f"Valor '{field}' está en la lista de valores excluidos en '{field_path}'")
+            if field in scheme.get('_excluded-equalities', scheme['excluded-equalities']):
+                return ExcludedValueError(field, field_path)
         
         if restrictions['str']['allowed-equalities'] in scheme:
-            if field not in scheme['allowed-equalities']:
-                return Exception(f"Valor '{field}' no está en la lista de valores permitidos en '{field_path}'")
+            if field not in scheme.get('_allowed-equalities', scheme['allowed-equalities']):
+                return NotAllowedValueError(field, field_path)
 
         if restrictions['str']['max-length'] in scheme:
             if len(field) > scheme['max-length']:
@@ -304,6 +779,53 @@ class DiSchema:
         return True
     
 
+    def binaries(self, field, scheme, field_path: str = "") -> bool | Exception:
+        """Validaciones específicas para bytes/bytearray/memoryview/mmap (sin copiar el buffer)"""
+        if field is None:
+            return Exception(f"Contenido binario no puede ser None en '{field_path}'")
+
+        try:
+            view = memoryview(field)
+        except TypeError:
+            return Exception(f"El campo debe ser un buffer binario en '{field_path}'")
+
+        with view:
+            if view.format != 'B' or view.ndim != 1:
+                view = view.cast('B')
+            size = view.nbytes
+
+            if restrictions['bytes']['max-length'] in scheme:
+                if size > scheme['max-length']:
+                    return ExcessLengthError(field, scheme['max-length'])
+
+            if restrictions['bytes']['min-length'] in scheme:
+                if size < scheme['min-length']:
+                    return MissingLengthError(field, scheme['min-length'])
+
+            if restrictions['bytes']['magic-prefix'] in scheme:
+                prefixes = scheme.get('_magic-prefix') or self._magic_prefixes(scheme['magic-prefix'])
+                if prefixes is None:
+                    return Exception(f"'magic-prefix' debe ser bytes o una lista de bytes en '{field_path}'")
+
+                # Comparar solo la cabecera mediante slicing del memoryview
+                if not any(view[:len(prefix)] == prefix for prefix in prefixes):
+                    return MagicPrefixError(list(prefixes), field_path)
+
+            if restrictions['bytes']['allowed-bytes'] in scheme:
+                forbidden = scheme.get('_allowed-bytes') or self._forbidden_bytes_pattern(scheme['allowed-bytes'])
+                if forbidden is None:
+                    return Exception(f"'allowed-bytes' debe ser bytes o una lista de enteros en '{field_path}'")
+
+                # Solo esta búsqueda recorre el buffer: longitud y prefijos no dependen de su tamaño
+                if self._budget is not None:
+                    self._budget.scan(size, field_path)
+
+                match = forbidden.search(view)
+                if match is not None:
+                    return NotAllowedByteError(view[match.start()], match.start(), field_path)
+
+        return True
+
     def lists(self, field, scheme, field_path: str = "") -> bool | Exception:
         """Validaciones específicas para listas con soporte completo de anidación"""
         if field is None:
@@ -311,6 +833,10 @@ class DiSchema:
             
         if not isinstance(field, list):
             return Exception(f"El campo debe ser una lista en '{field_path}'")
+
+        budget = self._budget
+        if budget is not None:
+            budget.items(len(field), field_path)
             
         if restrictions['list']['max-length'] in scheme:
             if len(field) > scheme['max-length']:
@@ -320,21 +846,42 @@ class DiSchema:
             if len(field) < scheme['min-length']:
                 return MissingLengthError(field)
         
+        # Unicidad de elementos (completos o por algunas claves de los elementos dict)
+        unique_by = scheme.get(restrictions['list']['unique-by'])
+        if scheme.get(restrictions['list']['unique-items']) or unique_by:
+            names = [unique_by] if isinstance(unique_by, str) else unique_by
+            from .uniqueness import ExactIndex
+            seen = ExactIndex()
+            for position, item in enumerate(field):
+                if names:
+                    # Solo se comparan elementos dict; los que no tienen todas las claves no cuentan
+                    if not isinstance(item, dict):
+                        return InvalidTypeError(f"{field_path}[{position}]", 'dict')
+                    if any(name not in item for name in names):
+                        continue
+                    item = item[names[0]] if len(names) == 1 else tuple(item[name] for name in names)
+                if seen.add(item):
+                    return DuplicateValueError(item, f"{field_path}[{position}]")
+
         # Validación de items permitidos - VERSIÓN CORREGIDA Y UNIFICADA
         if restrictions['list']['allowed-items'] in scheme:
             allowed_items = scheme['allowed-items']
             if not isinstance(allowed_items, list):
                 return Exception(f"'allowed-items' debe ser una lista en '{field_path}'")
             
+            sub_validators = scheme.get('_allowed-validators') or [None] * len(allowed_items)
+
             for position, item in enumerate(field):
                 item_path = f"{field_path}[{position}]"
+                if budget is not None:
+                    budget.visit(item_path)
                 valid_item = False
                 accumulated_errors = []
                 
-                for allowed_schema in allowed_items:
+                for allowed_schema, sub_validator in zip(allowed_items, sub_validators):
                     if isinstance(allowed_schema, dict):
                         # Es un esquema completo - validar recursivamente
-                        nested_errors = self._validate_nested_structure(item, allowed_schema, item_path)
+                        nested_errors = self._validate_nested_structure(item, allowed_schema, item_path, sub_validator)
                         
                         if len(nested_errors) == 0:
                             valid_item = True
@@ -345,7 +892,7 @@ class DiSchema:
                             
                     elif isinstance(allowed_schema, str):
                         # Es un tipo simple - verificar tipo directo
-                        if type(item).__name__ == allowed_schema:
+                        if self._matches_type(item, allowed_schema):
                             valid_item = True
                             break
                 
@@ -381,7 +928,9 @@ class DiSchema:
             nested_schema = scheme['schema']
             if isinstance(nested_schema, dict):
                 nested_path = f"{field_path}"
-                nested_errors = self._validate_nested_structure(field, nested_schema, nested_path)
+                nested_errors = self._validate_nested_structure(
+                    field, nested_schema, nested_path, scheme.get('_schema-validator')
+                )
                 
                 if nested_errors:
                     for error in nested_errors:
@@ -394,14 +943,18 @@ class DiSchema:
             if not isinstance(allowed_items, list):
                 return Exception(f"'allowed-items' debe ser una lista en '{field_path}'")
             
+            sub_validators = scheme.get('_allowed-validators') or [None] * len(allowed_items)
+
             for key, value in field.items():
                 value_path = f"{field_path}.{key}"
+                if self._budget is not None:
+                    self._budget.visit(value_path)
                 valid_item = False
                 
-                for allowed_schema in allowed_items:
+                for allowed_schema, sub_validator in zip(allowed_items, sub_validators):
                     if isinstance(allowed_schema, dict):
                         # Validar recursivamente cada valor
-                        nested_errors = self._validate_nested_structure(value, allowed_schema, value_path)
+                        nested_errors = self._validate_nested_structure(value, allowed_schema, value_path, sub_validator)
                         
                         if len(nested_errors) == 0:
                             valid_item = True
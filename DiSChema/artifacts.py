@@ -0,0 +1,34 @@
+# artifacts.py - Serialización de validadores preparados para arranques en frío rápidos
+import pickle
+from .exceptions import ArtifactError
+
+ARTIFACT_MAGIC = b'DISCHEMA'
+ARTIFACT_VERSION = 1
+
+def dump_artifact(validator, path) -> None:
+    """Escribe un validador preparado (esquema normalizado y sub-validadores) en disco"""
+    payload = pickle.dumps(validator, protocol=pickle.HIGHEST_PROTOCOL)
+    with open(path, 'wb') as file:
+        file.write(ARTIFACT_MAGIC)
+        file.write(ARTIFACT_VERSION.to_bytes(2, 'big'))
+        file.write(payload)
+
+def load_artifact(path):
+    """Carga un validador preparado sin volver a procesar el esquema"""
+    with open(path, 'rb') as file:
+        content = file.read()
+
+    header_size = len(ARTIFACT_MAGIC) + 2
+    if len(content) < header_size or not content.startswith(ARTIFACT_MAGIC):
+        raise ArtifactError(str(path), "cabecera desconocida")
+
+    version = int.from_bytes(content[len(ARTIFACT_MAGIC):header_size], 'big')
+    if version != ARTIFACT_VERSION:
+        raise ArtifactError(str(path), f"versión {version} no soportada (se esperaba {ARTIFACT_VERSION})")
+
+    validator = pickle.loads(content[header_size:])
+
+    from .DiSChema import DiSchema
+    if not isinstance(validator, DiSchema):
+        raise ArtifactError(str(path), "el contenido no es un validador DiSchema")
+    return validator
@@ -128,6 +128,42 @@ class InvalidExcludedCharsTypeError(DiSchemaError):
         path_str = f" en '{field_path}'" if field_path else ""
         super().__init__(f"'excluded-chars' debe ser una lista{path_str}")
 
+class PatternMismatchError(DiSchemaError):
+    """Error cuando una cadena no coincide con el patrón 'pattern'"""
+    def __init__(self, value, pattern: str, field_path: str = ""):
+        self.value = value
+        self.pattern = pattern
+        self.field_path = field_path
+        path_str = f" en '{field_path}'" if field_path else ""
+        super().__init__(f"Cadena '{value}' no coincide con el patrón '{pattern}'{path_str}")
+
+class InvalidFormatError(DiSchemaError):
+    """Error cuando una cadena no cumple el formato 'format'"""
+    def __init__(self, value, format_name: str, field_path: str = ""):
+        self.value = value
+        self.format_name = format_name
+        self.field_path = field_path
+        path_str = f" en '{field_path}'" if field_path else ""
+        super().__init__(f"Cadena '{value}' no tiene formato '{format_name}'{path_str}")
+
+# ====== ERRORES DE BYTES ======
+class MagicPrefixError(DiSchemaError):
+    """Error cuando un buffer binario no empieza por ningún prefijo permitido"""
+    def __init__(self, expected_prefixes, field_path: str = ""):
+        self.expected_prefixes = expected_prefixes
+        self.field_path = field_path
+        path_str = f" en '{field_path}'" if field_path else ""
+        super().__init__(f"El contenido binario no empieza por {expected_prefixes}{path_str}")
+
+class NotAllowedByteError(DiSchemaError):
+    """Error cuando un buffer binario contiene un byte no permitido"""
+    def __init__(self, byte: int, position: int, field_path: str = ""):
+        self.byte = byte
+        self.position = position
+        self.field_path = field_path
+        path_str = f" en '{field_path}'" if field_path else ""
+        super().__init__(f"Byte 0x{byte:02x} en posición {position} no está permitido{path_str}")
+
 # ====== ERRORES DE LISTA/DICCIONARIO ======
 class InvalidAllowedItemsTypeError(DiSchemaError):
     """Error cuando 'allowed-items' no es una lista"""
@@ -159,6 +195,14 @@ class InvalidValueSchemaError(DiSchemaError):
         self.field_path = field_path
         super().__init__(f"Valor para clave '{key}' ({field_path}) no coincide con ningún esquema permitido")
 
+class DuplicateValueError(DiSchemaError):
+    """Error cuando un valor que debe ser único ya apareció antes"""
+    def __init__(self, value, field_path: str = ""):
+        self.value = value
+        self.field_path = field_path
+        path_str = f" en '{field_path}'" if field_path else ""
+        super().__init__(f"Valor '{value}' duplicado{path_str}")
+
 # ====== ERRORES DE VALIDACIÓN ANIDADA ======
 class MaxNestingExceededError(DiSchemaError):
     """Error cuando se excede el máximo nivel de anidación"""
@@ -197,4 +241,23 @@ class InvalidDataTypeError(DiSchemaError):
         self.expected_type = expected_type
         self.actual_type = actual_type
         type_str = f" (actual: {actual_type})" if actual_type else ""
-        super().__init__(f"El campo debe ser {expected_type} en '{field_path}'{type_str}")
\ No newline at end of file
+        super().__init__(f"El campo debe ser {expected_type} en '{field_path}'{type_str}")
+
+# ====== ERRORES DE ARTEFACTOS ======
+class ArtifactError(DiSchemaError):
+    """Error cuando un artefacto de esquema compilado no se puede cargar"""
+    def __init__(self, path: str, reason: str):
+        self.path = path
+        self.reason = reason
+        super().__init__(f"Artefacto '{path}' inválido: {reason}")
+
+
+# ====== ERRORES DE LÍMITES DE RECURSOS ======
+class ValidationBudgetExceededError(DiSchemaError):
+    """Error cuando una validación supera uno de sus límites de recursos"""
+    def __init__(self, limit: str, maximum, field_path: str = ""):
+        self.limit = limit
+        self.maximum = maximum
+        self.field_path = field_path
+        path_str = f" en '{field_path}'" if field_path else ""
+        super().__init__(f"Límite '{limit}' ({maximum}) superado{path_str}")
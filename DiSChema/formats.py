@@ -0,0 +1,92 @@
+# formats.py - Reglas 'pattern' y 'format' para campos de tipo str
+import re
+from functools import lru_cache
+
+PATTERN_CACHE_SIZE = 512
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def compile_pattern(pattern: str) -> re.Pattern:
+    """Compila una expresión regular una sola vez por proceso (caché acotada)"""
+    return re.compile(pattern)
+
+_HEX = frozenset('0123456789abcdefABCDEF')
+_UUID_HYPHENS = (8, 13, 18, 23)
+
+def is_uuid(value: str) -> bool:
+    """UUID canónico de 36 caracteres (8-4-4-4-12) sin usar regex"""
+    if len(value) != 36:
+        return False
+    for position in _UUID_HYPHENS:
+        if value[position] != '-':
+            return False
+    return _HEX.issuperset(value.replace('-', '')) and value.count('-') == 4
+
+def is_email(value: str) -> bool:
+    """Comprobación estructural de email: local@dominio.tld sin espacios"""
+    local, at, domain = value.rpartition('@')
+    if not at or not local or not domain or len(value) > 254:
+        return False
+    if '@' in local or any(char.isspace() for char in value):
+        return False
+    labels = domain.split('.')
+    return len(labels) > 1 and all(labels)
+
+def is_date(value: str) -> bool:
+    """Fecha ISO-8601 de calendario (YYYY-MM-DD); no admite semanas ni ordinales"""
+    from datetime import date
+    # fromisoformat() también acepta '2024-W01-1' y, desde Python 3.11, formas sin guiones
+    if len(value) != 10 or value[4] != '-' or value[7] != '-':
+        return False
+    digits = value[:4] + value[5:7] + value[8:]
+    if not digits.isascii() or not digits.isdigit():
+        return False
+    try:
+        date.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
+
+def is_datetime(value: str) -> bool:
+    """Fecha y hora ISO-8601 (admite zona horaria y sufijo 'Z')"""
+    from datetime import datetime
+    if len(value) < 11 or value[10] not in 'Tt ' or not is_date(value[:10]):
+        return False
+    try:
+        datetime.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
+
+def is_ipv4(value: str) -> bool:
+    """Dirección IPv4 en notación decimal con puntos"""
+    parts = value.split('.')
+    if len(parts) != 4:
+        return False
+    for part in parts:
+        if not part.isascii() or not part.isdigit() or len(part) > 3:
+            return False
+        if len(part) > 1 and part[0] == '0':
+            return False
+        if int(part) > 255:
+            return False
+    return True
+
+def is_ipv6(value: str) -> bool:
+    """Dirección IPv6 (incluye formas comprimidas)"""
+    if ':' not in value:
+        return False
+    from ipaddress import IPv6Address, AddressValueError
+    try:
+        IPv6Address(value)
+    except AddressValueError:
+        return False
+    return True
+
+formats = {
+    'uuid': is_uuid,
+    'email': is_email,
+    'date': is_date,
+    'datetime': is_datetime,
+    'ipv4': is_ipv4,
+    'ipv6': is_ipv6
+}
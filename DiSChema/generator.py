@@ -0,0 +1,355 @@
+# generator.py - Generador de registros sintéticos a partir de un esquema DiSchema
+import json
+import math
+import random
+import string
+from .DiSChema import DiSchema
+from .uniqueness import ExactIndex
+
+_DEFAULT_CHARS = string.ascii_letters + string.digits
+
+# Intentos para generar un valor (o registro con 'verify') válido antes de rechazar el esquema
+_ATTEMPTS = 20
+
+def _unsupported(scheme: dict, path: str = "") -> None:
+    """Rechaza reglas para las que no se pueden generar valores válidos"""
+    for field, field_scheme in scheme.items():
+        if isinstance(field_scheme, dict):
+            _unsupported_field(field_scheme, f"{path}.{field}" if path else field)
+
+def _unsupported_field(scheme: dict, path: str) -> None:
+    if 'pattern' in scheme and 'equal' not in scheme and 'allowed-equalities' not in scheme:
+        raise ValueError(f"No se pueden generar valores para 'pattern' en '{path}' "
+                         f"(añada 'equal' o 'allowed-equalities')")
+
+    nested = scheme.get('schema')
+    if isinstance(nested, dict):
+        if 'type' in nested:
+            _unsupported_field(nested, path)
+        else:
+            _unsupported(nested, path)
+
+    for allowed_schema in scheme.get('allowed-items') or ():
+        if isinstance(allowed_schema, dict):
+            if 'type' in allowed_schema:
+                _unsupported_field(allowed_schema, f"{path}[*]")
+            else:
+                _unsupported(allowed_schema, f"{path}[*]")
+
+def _has_bytes(scheme: dict) -> bool:
+    """Indica si algún campo del esquema (también anidado) es de tipo 'bytes'"""
+    return any(isinstance(field_scheme, dict) and _field_has_bytes(field_scheme) for field_scheme in scheme.values())
+
+def _field_has_bytes(scheme: dict) -> bool:
+    if scheme.get('type') == 'bytes':
+        return True
+
+    nested = scheme.get('schema')
+    candidates = [nested] if isinstance(nested, dict) else []
+    for candidate in candidates + list(scheme.get('allowed-items') or ()):
+        if candidate == 'bytes':
+            return True
+        if isinstance(candidate, dict):
+            # Esquema de campo simple o esquema completo con varios campos
+            found = _field_has_bytes(candidate) if 'type' in candidate else _has_bytes(candidate)
+            if found:
+                return True
+    return False
+
+class SchemaGenerator:
+    """Genera registros válidos (y opcionalmente inválidos) de forma reproducible
+
+    Los registros válidos se construyen respetando las reglas de cada campo y
+    no se validan; si una regla no se puede cumplir se lanza ValueError. Solo
+    los registros mutados se comprueban con check(), así que la etiqueta de
+    validez siempre coincide. 'verify' comprueba también los válidos, para
+    esquemas con reglas que se contradicen entre sí (p. ej. 'format' con
+    'max-length'). Las reglas que no se saben generar ('pattern' sin valores
+    fijos) se rechazan al crear el generador con ValueError.
+    """
+    def __init__(self, scheme: dict, seed: int = 0, invalid_rate: float = 0.0, optional_rate: float = 0.8,
+                 verify: bool = False) -> None:
+        _unsupported(scheme)
+        self.scheme = scheme
+        self.validator = DiSchema(scheme)
+        self.seed = seed
+        self.invalid_rate = invalid_rate
+        self.optional_rate = optional_rate  # Probabilidad de incluir campos no requeridos
+        self.verify = verify
+        self.random = random.Random(seed)
+
+        self.generators = {
+            'str': self._string,
+            'int': self._integer,
+            'float': self._float,
+            'bool': self._boolean,
+            'list': self._list,
+            'dict': self._dict,
+            'bytes': self._bytes
+        }
+
+    def record(self) -> tuple[dict, bool]:
+        """Genera un registro y si es válido según check()"""
+        record = self._fields(self.scheme)
+        if self.verify:
+            for _ in range(_ATTEMPTS):
+                result = self.validator.check(record)
+                if result['valid']:
+                    break
+                record = self._fields(self.scheme)
+            else:
+                raise ValueError(f"No se pudo generar un registro válido: {result['errors'][0]}")
+
+        if self.invalid_rate and self.random.random() < self.invalid_rate and self._corrupt(record):
+            # Una mutación puede no romper nada (p. ej. null en un campo que lo admite)
+            return record, self.validator.check(record)['valid']
+        return record, True
+
+    def records(self, count: int = None, labeled: bool = False):
+        """Flujo perezoso de registros (infinito si 'count' es None)"""
+        produced = 0
+        while count is None or produced < count:
+            record, valid = self.record()
+            yield (record, valid) if labeled else record
+            produced += 1
+
+    def write_ndjson(self, path, count: int, labeled: bool = False, hex_bytes: bool = False) -> int:
+        """Escribe 'count' registros en un fichero NDJSON
+
+        Con 'labeled' cada línea es {"record": ..., "valid": ...} y conserva la
+        validez esperada. JSON no tiene bytes: los esquemas con campos 'bytes'
+        se rechazan salvo con 'hex_bytes', que los escribe en hexadecimal (esas
+        líneas ya no cumplen el esquema original al volver a leerlas).
+        """
+        if not hex_bytes and _has_bytes(self.scheme):
+            raise ValueError("El esquema tiene campos 'bytes', que no se pueden escribir en JSON "
+                             "(use hex_bytes=True para codificarlos en hexadecimal)")
+
+        with open(path, 'w', encoding='utf-8') as file:
+            for record, valid in self.records(count, labeled=True):
+                line = {'record': record, 'valid': valid} if labeled else record
+                file.write(json.dumps(line, default=lambda value: bytes(value).hex()))
+                file.write('\n')
+        return count
+
+    # ====== VALORES VÁLIDOS ======
+    def _fields(self, scheme: dict) -> dict:
+        record = {}
+        for field, field_scheme in scheme.items():
+            if not field_scheme.get('required') and self.random.random() >= self.optional_rate:
+                continue
+            record[field] = self._value(field_scheme)
+        return record
+
+    def _value(self, scheme: dict):
+        generator = self.generators.get(scheme.get('type'))
+        if generator is None:
+            return None
+        return generator(scheme)
+
+    def _pick(self, scheme: dict):
+        """Valor fijo de 'equal' o uno de 'allowed-equalities' no excluido"""
+        if 'equal' in scheme:
+            return True, scheme['equal']
+
+        if 'allowed-equalities' in scheme:
+            excluded = scheme.get('excluded-equalities', ())
+            candidates = [value for value in scheme['allowed-equalities'] if value not in excluded]
+            if not candidates:
+                raise ValueError("Todos los valores de 'allowed-equalities' están excluidos")
+            return True, self.random.choice(candidates)
+        return False, None
+
+    def _length(self, scheme: dict, spread: int) -> int:
+        minimum = scheme.get('min-length', 0)
+        maximum = scheme.get('max-length', minimum + spread)
+        if minimum > maximum:
+            raise ValueError(f"Longitud imposible: 'min-length' {minimum} > 'max-length' {maximum}")
+        return self.random.randint(minimum, maximum)
+
+    def _string(self, scheme: dict) -> str:
+        picked, value = self._pick(scheme)
+        if picked:
+            return value
+
+        if scheme.get('format') in _formats:
+            return _formats[scheme['format']](self.random)
+
+        excluded = scheme.get('excluded-chars', [])
+        alphabet = [char for char in scheme.get('allowed-chars', _DEFAULT_CHARS) if char not in excluded]
+        if not alphabet:
+            if scheme.get('min-length', 0) > 0:
+                raise ValueError("No hay caracteres permitidos para cumplir 'min-length'")
+            return ''
+
+        excluded_values = scheme.get('excluded-equalities', ())
+        for _ in range(_ATTEMPTS):
+            value = ''.join(self.random.choices(alphabet, k=self._length(scheme, 16)))
+            # 'excluded-chars' admite subcadenas de varios caracteres
+            if value not in excluded_values and not any(chars in value for chars in excluded):
+                return value
+        raise ValueError("No se pudo generar una cadena fuera de 'excluded-chars'/'excluded-equalities'")
+
+    def _number(self, scheme: dict, draw):
+        picked, value = self._pick(scheme)
+        if picked:
+            return value
+
+        maximum = scheme.get('max-size')
+        # Sin 'min-size' el rango termina en 'max-size' aunque sea negativo
+        minimum = scheme.get('min-size', 0 if maximum is None else min(0, maximum - 1000))
+        if maximum is None:
+            maximum = minimum + 1000
+        if draw == self.random.randint:
+            minimum, maximum = math.ceil(minimum), math.floor(maximum)
+        if minimum > maximum:
+            raise ValueError(f"Rango vacío: 'min-size' {minimum} > 'max-size' {maximum}")
+
+        excluded_values = scheme.get('excluded-equalities', ())
+        for _ in range(_ATTEMPTS):
+            value = draw(minimum, maximum)
+            if value not in excluded_values:
+                return value
+        raise ValueError(f"No se pudo generar un número en [{minimum}, {maximum}] fuera de 'excluded-equalities'")
+
+    def _integer(self, scheme: dict) -> int:
+        return self._number(scheme, self.random.randint)
+
+    def _float(self, scheme: dict) -> float:
+        return float(self._number(scheme, self.random.uniform))
+
+    def _boolean(self, scheme: dict) -> bool:
+        picked, value = self._pick(scheme)
+        return value if picked else self.random.random() < 0.5
+
+    def _item(self, allowed_items: list):
+        """Elemento que coincide con uno de los esquemas de 'allowed-items'"""
+        allowed_schema = self.random.choice(allowed_items)
+        if isinstance(allowed_schema, str):
+            return self._value({'type': allowed_schema})
+        return self._nested(allowed_schema)
+
+    def _nested(self, schema: dict):
+        # Esquema de campo simple o esquema completo con varios campos
+        if 'type' in schema:
+            return self._value(schema)
+        return self._fields(schema)
+
+    def _list(self, scheme: dict) -> list:
+        allowed_items = scheme.get('allowed-items') or ['int']
+        size = self._length(scheme, 3)
+
+        unique_by = scheme.get('unique-by')
+        if not scheme.get('unique-items') and not unique_by:
+            return [self._item(allowed_items) for _ in range(size)]
+
+        # Elementos distintos: completos o por las claves de 'unique-by' (solo elementos dict)
+        names = [unique_by] if isinstance(unique_by, str) else unique_by
+        if names:
+            allowed_items = [item for item in allowed_items if isinstance(item, dict) and 'type' not in item]
+            if not allowed_items:
+                raise ValueError("'unique-by' necesita esquemas de diccionario en 'allowed-items'")
+
+        seen = ExactIndex()
+        items = []
+        for _ in range(size * _ATTEMPTS):
+            if len(items) == size:
+                break
+            item = self._item(allowed_items)
+            if names:
+                if any(name not in item for name in names):
+                    items.append(item)  # Los elementos sin la clave no cuentan para la unicidad
+                    continue
+                key = item[names[0]] if len(names) == 1 else tuple(item[name] for name in names)
+            else:
+                key = item
+            if not seen.add(key):
+                items.append(item)
+
+        if len(items) < scheme.get('min-length', 0):
+            raise ValueError(f"No hay suficientes elementos distintos para 'min-length' {scheme['min-length']}")
+        return items
+
+    def _dict(self, scheme: dict) -> dict:
+        if isinstance(scheme.get('schema'), dict):
+            return self._nested(scheme['schema'])
+
+        if 'allowed-items' not in scheme:
+            return {f"key{index}": self._value({'type': 'str'}) for index in range(self._length(scheme, 3))}
+
+        # Los valores de un dict solo se validan contra esquemas (no contra nombres de tipo)
+        allowed_items = [item for item in scheme['allowed-items'] if isinstance(item, dict)]
+        if not allowed_items:
+            if scheme.get('min-length', 0) > 0:
+                raise ValueError("'allowed-items' sin esquemas de diccionario no admite 'min-length'")
+            return {}
+        return {f"key{index}": self._item(allowed_items) for index in range(self._length(scheme, 3))}
+
+    def _bytes(self, scheme: dict) -> bytes:
+        prefix = scheme.get('magic-prefix', b'')
+        if isinstance(prefix, (list, tuple)):
+            prefix = self.random.choice(prefix) if prefix else b''
+        prefix = bytes(prefix)
+
+        allowed = scheme.get('allowed-bytes', range(256))
+        allowed = list(bytes(allowed)) if isinstance(allowed, (bytes, bytearray)) else list(allowed)
+        size = max(self._length(scheme, 64), len(prefix)) - len(prefix)
+        return prefix + bytes(self.random.choices(allowed, k=size)) if allowed else prefix
+
+    # ====== VALORES INVÁLIDOS ======
+    def _corrupt(self, record: dict) -> bool:
+        """Rompe una regla de un campo al azar; devuelve False si no hay nada que romper"""
+        mutations = []
+        for field, field_scheme in self.scheme.items():
+            if field_scheme.get('required'):
+                mutations.append(('missing', field, field_scheme))
+            if field in record:
+                mutations.append(('null', field, field_scheme))
+                if 'max-length' in field_scheme and field_scheme.get('type') == 'str':
+                    mutations.append(('max-length', field, field_scheme))
+                if 'max-size' in field_scheme and field_scheme.get('type') in ('int', 'float'):
+                    mutations.append(('max-size', field, field_scheme))
+
+        if not mutations:
+            return False
+
+        mutation, field, field_scheme = self.random.choice(mutations)
+        if mutation == 'missing':
+            record.pop(field, None)
+        elif mutation == 'null':
+            record[field] = None
+        elif mutation == 'max-length':
+            record[field] = 'x' * (field_scheme['max-length'] + 1)
+        elif mutation == 'max-size':
+            record[field] = field_scheme['max-size'] + 1
+        return True
+
+# ====== FORMATOS ======
+def _uuid(rng: random.Random) -> str:
+    value = f"{rng.getrandbits(128):032x}"
+    return f"{value[:8]}-{value[8:12]}-{value[12:16]}-{value[16:20]}-{value[20:]}"
+
+def _email(rng: random.Random) -> str:
+    user = ''.join(rng.choices(string.ascii_lowercase, k=8))
+    return f"{user}@example.com"
+
+def _date(rng: random.Random) -> str:
+    return f"{rng.randint(1970, 2037):04d}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+
+def _datetime(rng: random.Random) -> str:
+    return f"{_date(rng)}T{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}"
+
+def _ipv4(rng: random.Random) -> str:
+    return '.'.join(str(rng.randint(0, 255)) for _ in range(4))
+
+def _ipv6(rng: random.Random) -> str:
+    return ':'.join(f"{rng.getrandbits(16):x}" for _ in range(8))
+
+_formats = {
+    'uuid': _uuid,
+    'email': _email,
+    'date': _date,
+    'datetime': _datetime,
+    'ipv4': _ipv4,
+    'ipv6': _ipv6
+}
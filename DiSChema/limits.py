@@ -0,0 +1,55 @@
+# limits.py - Presupuesto de recursos compartido por una llamada a check()
+from time import monotonic
+from .exceptions import ValidationBudgetExceededError
+from .properties import restrictions
+
+def validate_limits(limits: dict) -> dict:
+    """Comprueba los límites una sola vez, al construir el validador"""
+    if not isinstance(limits, dict):
+        raise TypeError(f"'limits' debe ser un diccionario, no {type(limits).__name__}")
+    unknown = set(limits) - set(restrictions['limits'])
+    if unknown:
+        raise ValueError(f"Límites desconocidos: {sorted(unknown)}")
+    return limits
+
+class ValidationBudget:
+    """Contadores de nodos, bytes de texto y tiempo para una sola validación
+
+    'max-nodes' cuenta el trabajo total: los nodos copiados por check() (también
+    las copias de los sub-validadores) y los nodos visitados al validar.
+    """
+    def __init__(self, limits: dict) -> None:
+        # Las claves ya se comprobaron con validate_limits() al crear el validador
+        self.max_nodes = limits.get('max-nodes')
+        self.max_string_bytes = limits.get('max-string-bytes')
+        self.max_list_items = limits.get('max-list-items')
+        self.timeout = limits.get('timeout')
+        self.deadline = None if self.timeout is None else monotonic() + self.timeout
+        self.nodes = 0
+        self.string_bytes = 0
+
+    def visit(self, field_path: str = "", count: int = 1) -> None:
+        """Cuenta nodos visitados y comprueba la fecha límite"""
+        self.nodes += count
+        if self.max_nodes is not None and self.nodes > self.max_nodes:
+            raise ValidationBudgetExceededError('max-nodes', self.max_nodes, field_path)
+        if self.deadline is not None and monotonic() > self.deadline:
+            raise ValidationBudgetExceededError('timeout', self.timeout, field_path)
+
+    def scan(self, size: int, field_path: str = "") -> None:
+        """Cuenta los bytes de texto o binarios que se van a recorrer"""
+        self.string_bytes += size
+        if self.max_string_bytes is not None and self.string_bytes > self.max_string_bytes:
+            raise ValidationBudgetExceededError('max-string-bytes', self.max_string_bytes, field_path)
+
+    def text(self, value: str, field_path: str = "") -> None:
+        """Cuenta los bytes UTF-8 de una cadena (sin codificarla si es ASCII)"""
+        # Cada carácter ocupa al menos un byte: cadenas enormes se rechazan sin codificarlas
+        if self.max_string_bytes is not None and self.string_bytes + len(value) > self.max_string_bytes:
+            raise ValidationBudgetExceededError('max-string-bytes', self.max_string_bytes, field_path)
+        self.scan(len(value) if value.isascii() else len(value.encode('utf-8', 'surrogatepass')), field_path)
+
+    def items(self, size: int, field_path: str = "") -> None:
+        """Comprueba el número de elementos de una lista antes de recorrerla"""
+        if self.max_list_items is not None and size > self.max_list_items:
+            raise ValidationBudgetExceededError('max-list-items', self.max_list_items, field_path)
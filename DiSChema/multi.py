@@ -0,0 +1,124 @@
+# multi.py - Validación de un registro contra varias versiones de esquema en una sola pasada
+from .DiSChema import DiSchema, _copy_data
+from .exceptions import ValidationBudgetExceededError
+from .limits import ValidationBudget, validate_limits
+
+def _freeze(value):
+    """Clave hashable y estable para comparar reglas entre versiones"""
+    if isinstance(value, dict):
+        return ('dict', tuple(sorted((str(key), _freeze(item)) for key, item in value.items())))
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(_freeze(item) for item in value))
+    if isinstance(value, (set, frozenset)):
+        return ('set', tuple(sorted(repr(_freeze(item)) for item in value)))
+    return (type(value).__name__, repr(value))
+
+class MultiSchema:
+    """Fusiona varias versiones de esquema: cada regla compartida se valida una sola vez"""
+    def __init__(self, schemes: dict, limits: dict = None) -> None:
+        self.schemes = schemes
+        self.limits = validate_limits(limits) if limits is not None else None
+        self.groups = []  # [(campo, validador de un solo campo, muta los datos)]
+        self.versions = {}  # versión -> índices de grupo en el orden de sus campos
+
+        group_index = {}
+        for version, scheme in schemes.items():
+            indexes = []
+            for field, field_scheme in scheme.items():
+                key = (field, _freeze(field_scheme))
+                if key not in group_index:
+                    group_index[key] = len(self.groups)
+                    mutates = isinstance(field_scheme, dict) and (
+                        'default-value' in field_scheme or field_scheme.get('try-transformation')
+                    )
+                    self.groups.append((field, DiSchema({field: field_scheme}, stop=False), bool(mutates)))
+                indexes.append(group_index[key])
+            self.versions[version] = indexes
+
+    def check(self, data: dict) -> dict:
+        """Valida los datos contra todas las versiones y devuelve las que se cumplen
+
+        Cada versión recibe su propia copia con los valores por defecto y las
+        transformaciones de sus campos (en 'results'); 'data' usa la de 'best'.
+        """
+        processed_data = {'original': data, 'copy': data}
+        budget = ValidationBudget(self.limits) if self.limits is not None else None
+        group_errors = []
+        group_copies = []  # Copia modificada por cada grupo que muta (None si no muta)
+
+        try:
+            processed_data['copy'] = _copy_data(data, budget=budget)
+            for field, validator, mutates in self.groups:
+                validator.errors = []
+                validator._nesting_level = 0
+                validator._budget = budget
+
+                # Los campos que se modifican (valor por defecto/transformación) trabajan sobre una copia superficial
+                copy = processed_data['copy']
+                if mutates and isinstance(copy, dict):
+                    copy = dict(copy)
+
+                result = validator._check_fields({'original': data, 'copy': copy})
+                group_errors.append(result['errors'])
+                group_copies.append(result['data']['copy'] if mutates else None)
+        except ValidationBudgetExceededError as error:
+            return {
+                'data': processed_data,
+                'valid': False,
+                'versions': [],
+                'best': None,
+                'errors': [error],
+                'results': {}
+            }
+        finally:
+            for field, validator, mutates in self.groups:
+                validator._budget = None
+
+        results = {}
+        for version, indexes in self.versions.items():
+            errors = [error for index in indexes for error in group_errors[index]]
+            results[version] = {
+                'valid': len(errors) == 0,
+                'errors': errors,
+                'data': self._version_copy(processed_data['copy'], indexes, group_copies)
+            }
+
+        matching = [version for version, result in results.items() if result['valid']]
+        # Mejor coincidencia: la última versión válida o, si no hay, la de menos errores
+        if matching:
+            best = matching[-1]
+        else:
+            best = min(results, key=lambda version: len(results[version]['errors']), default=None)
+
+        if best is not None:
+            processed_data['copy'] = results[best]['data']
+
+        return {
+            'data': processed_data,
+            'valid': len(matching) > 0,
+            'versions': matching,
+            'best': best,
+            'errors': results[best]['errors'] if best is not None else [],
+            'results': results
+        }
+
+    def _version_copy(self, copy, indexes: list, group_copies: list):
+        """Copia de una versión con los campos modificados por sus grupos
+
+        Las versiones sin campos que muten comparten la copia común.
+        """
+        if not isinstance(copy, dict):
+            return copy
+
+        version_copy = None
+        for index in indexes:
+            mutated = group_copies[index]
+            if mutated is None:
+                continue
+            if version_copy is None:
+                version_copy = dict(copy)
+
+            field = self.groups[index][0]
+            if field in mutated:
+                version_copy[field] = mutated[field]
+        return copy if version_copy is None else version_copy
@@ -0,0 +1,141 @@
+# projection.py - Rutas de campos para validación parcial (check(data, only=..., exclude=...))
+import re
+
+# Comodines: '[*]' para elementos de listas y '*' para valores de diccionarios
+LIST_WILDCARD = '[*]'
+DICT_WILDCARD = '*'
+
+# Marca de subárbol omitido: no se recorre ni se copia
+SKIP = object()
+
+# Validadores proyectados que se conservan por validador (los más antiguos se descartan)
+PROJECTION_CACHE_SIZE = 64
+
+_path_token = re.compile(r'\[\*\]|[^.\[\]]+')
+
+def path_tree(paths) -> dict | None:
+    """Convierte rutas como 'users[*].name' en un árbol {clave: subárbol o True}"""
+    if not paths:
+        return None
+
+    if isinstance(paths, str):
+        paths = [paths]
+
+    tree = {}
+    for path in paths:
+        tokens = _path_token.findall(path)
+        if not tokens:
+            raise ValueError(f"Ruta de campo inválida: '{path}'")
+
+        node = tree
+        for token in tokens[:-1]:
+            child = node.get(token)
+            if child is True:
+                break  # Un prefijo ya selecciona todo el subárbol
+            node = node.setdefault(token, {})
+        else:
+            node[tokens[-1]] = True
+    return tree
+
+def _join(prefix: str, key: str) -> str:
+    if key == LIST_WILDCARD:
+        return f"{prefix}{key}"
+    return f"{prefix}.{key}" if prefix else key
+
+def _children(node, key: str) -> list:
+    """Esquemas alcanzables desde 'node' (esquema completo o de campo) por el segmento 'key'
+
+    Los nombres de tipo de 'allowed-items' se devuelven como None: no tienen subrutas.
+    """
+    if not isinstance(node, dict):
+        return []
+
+    # Esquema completo: el segmento es un campo (o '*' para todos)
+    if 'type' not in node:
+        if key == DICT_WILDCARD:
+            return list(node.values())
+        return [node[key]] if key in node else []
+
+    allowed_items = node.get('allowed-items')
+    items = [item if isinstance(item, dict) else None for item in allowed_items] \
+        if isinstance(allowed_items, list) else [None]
+
+    if node['type'] == 'list':
+        return items if key == LIST_WILDCARD else []
+
+    if node['type'] == 'dict':
+        children = _children(node['schema'], key) if isinstance(node.get('schema'), dict) else []
+        if key == DICT_WILDCARD:
+            children += items
+        return children
+    return []
+
+def validate_paths(tree: dict | None, scheme: dict, prefix: str = "") -> None:
+    """Lanza ValueError si algún segmento de las rutas no existe en el esquema"""
+    if tree is None:
+        return
+
+    for key, child in tree.items():
+        path = _join(prefix, key)
+        children = _children(scheme, key)
+        if not children:
+            raise ValueError(f"Segmento desconocido '{key}' en la ruta '{path}'")
+        if child is True:
+            continue
+
+        # Basta con que una de las alternativas (p. ej. de 'allowed-items') tenga la subruta
+        error = None
+        for node in children:
+            try:
+                validate_paths(child, node, path)
+                break
+            except ValueError as child_error:
+                error = error or child_error
+        else:
+            raise error or ValueError(f"La ruta '{path}' no admite subrutas")
+
+def _lookup(tree: dict, key: str):
+    if key in tree:
+        return tree[key]
+    return tree.get(DICT_WILDCARD)
+
+def select_only(tree: dict | None, key: str):
+    """Subárbol seleccionado para 'key': None (todo), dict (parte) o SKIP (nada)"""
+    if tree is None:
+        return None
+    child = _lookup(tree, key)
+    if child is None:
+        return SKIP
+    return None if child is True else child
+
+def select_exclude(tree: dict | None, key: str):
+    """Subárbol excluido para 'key': None (nada), dict (parte) o SKIP (todo)"""
+    if tree is None:
+        return None
+    child = _lookup(tree, key)
+    if child is True:
+        return SKIP
+    return child
+
+def project_copy(value, only: dict | None, exclude: dict | None, copier):
+    """Copia solo las rutas seleccionadas; el resto se comparte sin recorrerse"""
+    if only is None and exclude is None:
+        return copier(value)
+
+    if type(value) is dict:
+        result = dict(value)
+        for key, item in value.items():
+            item_only = select_only(only, key)
+            item_exclude = select_exclude(exclude, key)
+            if item_only is not SKIP and item_exclude is not SKIP:
+                result[key] = project_copy(item, item_only, item_exclude, copier)
+        return result
+
+    if type(value) is list:
+        item_only = select_only(only, LIST_WILDCARD)
+        item_exclude = select_exclude(exclude, LIST_WILDCARD)
+        if item_only is SKIP or item_exclude is SKIP:
+            return list(value)
+        return [project_copy(item, item_only, item_exclude, copier) for item in value]
+
+    return copier(value)
@@ -4,9 +4,30 @@ types = {
     'float': float,
     'bool': bool,
     'dict': dict,
-    'list': list
+    'list': list,
+    'bytes': bytes
 }
 
+def _to_bytes(value) -> bytes:
+    """Transformación a bytes: texto en UTF-8 o cualquier buffer; nunca bytes(int)"""
+    if isinstance(value, str):
+        return value.encode('utf-8')
+    return bytes(memoryview(value))  # TypeError si no es un buffer
+
+# Conversiones de 'try-transformation' que no se hacen llamando al tipo
+transformations = {
+    'bytes': _to_bytes
+}
+
+# Familias de tipos: nombres de tipo aceptados para cada tipo del esquema
+type_families = {
+    'bytes': ('bytes', 'bytearray', 'memoryview', 'mmap')
+}
+
+# Buffers binarios: se validan por slicing y nunca se copian en profundidad
+# (mmap se reconoce por el nombre del tipo para no importar el módulo)
+binary_types = (bytes, bytearray, memoryview)
+
 restrictions = {
     'str': {
         'excluded-chars': 'excluded-chars',
@@ -15,7 +36,9 @@ restrictions = {
         'min-length': 'min-length',
         'allowed-equalities': 'allowed-equalities',
         'excluded-equalities': 'excluded-equalities',
-        'allowed-chars': 'allowed-chars'
+        'allowed-chars': 'allowed-chars',
+        'pattern': 'pattern',
+        'format': 'format'
     },
     'number': {
         'equal': 'equal',
@@ -27,10 +50,18 @@ restrictions = {
     'bool': {
         'equal': 'equal'
     },
+    'bytes': {
+        'max-length': 'max-length',
+        'min-length': 'min-length',
+        'magic-prefix': 'magic-prefix',
+        'allowed-bytes': 'allowed-bytes'
+    },
     'list': {
         'max-length': 'max-length',
         'min-length': 'min-length',
-        'allowed-items': 'allowed-items'
+        'allowed-items': 'allowed-items',
+        'unique-items': 'unique-items',
+        'unique-by': 'unique-by'
     },
     'dict': {
         'max-length': 'max-length',
@@ -38,11 +69,18 @@ restrictions = {
         'allowed-items': 'allowed-items',
         'schema': 'schema'
     },
+    'limits': {
+        'max-nodes': 'max-nodes',
+        'max-string-bytes': 'max-string-bytes',
+        'max-list-items': 'max-list-items',
+        'timeout': 'timeout'
+    },
     'fields': {
         'type': 'type',
         'required': 'required',
         'raise': 'raise',
         'try-transformation': 'try-transformation',
-        'default-value': 'default-value'
+        'default-value': 'default-value',
+        'unique': 'unique'
     }
 }
\ No newline at end of file
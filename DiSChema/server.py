@@ -0,0 +1,354 @@
+# server.py - Demonio local de validación (socket Unix) con esquemas preparados en memoria
+import json
+import os
+import queue
+import socket
+import socketserver
+import stat
+import struct
+import threading
+from .DiSChema import DiSchema
+
+# Marcos: NDJSON (una línea por mensaje) o longitud de 4 bytes big-endian + JSON
+_FRAME_HEADER = struct.Struct('>I')
+MAX_FRAME_SIZE = 64 * 1024 * 1024
+
+# Una cabecera válida (tamaño <= MAX_FRAME_SIZE) empieza por un byte 0x00-0x04:
+# cualquier otro byte (salvo espacios en blanco) inicia un mensaje NDJSON
+_MAX_HEADER_BYTE = MAX_FRAME_SIZE >> 24
+_WHITESPACE = b' \t\r\n'
+
+def _serialize_error(error: Exception) -> dict:
+    return {'type': type(error).__name__, 'message': str(error)}
+
+def _read_message(stream) -> tuple | None:
+    """Lee un mensaje y devuelve (contenido, framed) o None si se cerró la conexión"""
+    first = stream.read(1)
+    while first and first in _WHITESPACE:
+        first = stream.read(1)  # Líneas en blanco o espacios entre mensajes
+    if not first:
+        return None
+
+    if first[0] > _MAX_HEADER_BYTE:
+        # Leer como mucho el tamaño máximo más el salto de línea: una línea sin fin no agota la memoria
+        line = first + stream.readline(MAX_FRAME_SIZE)
+        if len(line) > MAX_FRAME_SIZE and not line.endswith(b'\n'):
+            raise ValueError(f"Línea de más de {MAX_FRAME_SIZE} bytes excede el máximo ({MAX_FRAME_SIZE})")
+        return json.loads(line), False
+
+    header = first + stream.read(_FRAME_HEADER.size - 1)
+    if len(header) < _FRAME_HEADER.size:
+        return None
+    (size,) = _FRAME_HEADER.unpack(header)
+    if size > MAX_FRAME_SIZE:
+        raise ValueError(f"Marco de {size} bytes excede el máximo ({MAX_FRAME_SIZE})")
+
+    payload = stream.read(size)
+    if len(payload) < size:
+        return None
+    return json.loads(payload), True
+
+def _encode_message(message: dict, framed: bool) -> bytes:
+    payload = json.dumps(message, default=str).encode()
+    if framed:
+        return _FRAME_HEADER.pack(len(payload)) + payload
+    return payload + b'\n'
+
+class _PendingRequest:
+    """Petición en cola a la espera de su resultado"""
+    __slots__ = ('message', 'response', 'done')
+
+    def __init__(self, message: dict) -> None:
+        self.message = message
+        self.response = None
+        self.done = threading.Event()
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        server = self.server.validation_server
+        while True:
+            try:
+                received = _read_message(self.rfile)
+            except ValueError as error:
+                # JSON inválido o marco demasiado grande: no se puede seguir leyendo
+                self.wfile.write(_encode_message({'error': _serialize_error(error)}, False))
+                return
+            if received is None:
+                return
+
+            message, framed = received
+            if isinstance(message, dict):
+                pending = server.submit(message)
+                pending.done.wait()
+                response = pending.response
+            else:
+                error = TypeError(f"El mensaje debe ser un objeto JSON, no {type(message).__name__}")
+                response = {'id': None, 'error': _serialize_error(error)}
+
+            try:
+                self.wfile.write(_encode_message(response, framed))
+                self.wfile.flush()
+            except OSError:
+                return  # El cliente o stop() cerró la conexión
+
+class _UnixServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+    request_queue_size = 128  # Muchos clientes locales conectando a la vez
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.connections = set()  # Conexiones abiertas: stop() las cierra
+
+    def process_request(self, request, client_address) -> None:
+        self.connections.add(request)
+        super().process_request(request, client_address)
+
+    def shutdown_request(self, request) -> None:
+        self.connections.discard(request)
+        super().shutdown_request(request)
+
+    def close_connections(self) -> None:
+        for request in list(self.connections):
+            try:
+                request.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+class ValidationServer:
+    """Mantiene validadores preparados y agrupa peticiones concurrentes en micro-lotes"""
+    def __init__(self, registry: dict, path: str, batch_window: float = 0, max_batch: int = 256) -> None:
+        self.validators = {name: self._prepare(entry) for name, entry in registry.items()}
+        self.path = path
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self._queue = queue.Queue()
+        self._server = None
+        self._worker = None
+
+    @staticmethod
+    def _prepare(entry) -> DiSchema:
+        """Acepta validadores, esquemas o rutas de artefactos"""
+        if isinstance(entry, DiSchema):
+            return entry
+        if isinstance(entry, dict):
+            return DiSchema(entry)
+        return DiSchema.load(entry)
+
+    def submit(self, message: dict) -> _PendingRequest:
+        pending = _PendingRequest(message)
+        self._queue.put(pending)
+        return pending
+
+    def _next_batch(self) -> list | None:
+        """Espera una petición y recoge las que ya estén en cola
+
+        Con 'batch_window' > 0 espera además hasta ese tiempo por cada petición
+        adicional; por defecto (0) no añade latencia y solo vacía la cola.
+        """
+        first = self._queue.get()
+        if first is None:
+            return None
+
+        batch = [first]
+        while len(batch) < self.max_batch:
+            try:
+                if self.batch_window > 0:
+                    pending = self._queue.get(timeout=self.batch_window)
+                else:
+                    pending = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if pending is None:
+                self._queue.put(None)  # Reencolar la señal de parada
+                break
+            batch.append(pending)
+        return batch
+
+    def _run_worker(self) -> None:
+        """Un único hilo valida los lotes: los validadores no se comparten entre hilos"""
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+
+            # Agrupar por esquema para validar cada grupo con el mismo validador en caliente
+            groups = {}
+            for pending in batch:
+                name = pending.message.get('schema')
+                if not isinstance(name, str):
+                    error = TypeError("'schema' debe ser el nombre de un esquema registrado")
+                    pending.response = {'id': pending.message.get('id'), 'error': _serialize_error(error)}
+                    pending.done.set()
+                    continue
+                groups.setdefault(name, []).append(pending)
+
+            for name, requests in groups.items():
+                validator = self.validators.get(name)
+                for pending in requests:
+                    # Una petición mal formada no debe detener el hilo ni dejar esperando al cliente
+                    try:
+                        pending.response = self._validate(validator, name, pending.message)
+                    except Exception as error:
+                        pending.response = {'id': pending.message.get('id'), 'error': _serialize_error(error)}
+                    finally:
+                        pending.done.set()
+
+    @staticmethod
+    def _validate(validator: DiSchema | None, name, message: dict) -> dict:
+        response = {'id': message.get('id')}
+        if validator is None:
+            response['error'] = {'type': 'KeyError', 'message': f"Esquema '{name}' no registrado"}
+            return response
+
+        try:
+            if 'records' in message:
+                # Serializar cada resultado antes de la siguiente llamada (la lista de errores se reutiliza)
+                response['results'] = []
+                for record in message['records']:
+                    result = validator.check(record)
+                    response['results'].append({
+                        'valid': result['valid'],
+                        'errors': [_serialize_error(error) for error in result['errors']]
+                    })
+            else:
+                result = validator.check(message.get('data'))
+                response['valid'] = result['valid']
+                response['errors'] = [_serialize_error(error) for error in result['errors']]
+        except Exception as error:
+            # Errores lanzados por campos con 'raise'
+            response['valid'] = False
+            response['errors'] = [_serialize_error(error)]
+        return response
+
+    def _remove_stale_socket(self) -> None:
+        """Borra el socket de un servidor que terminó sin limpiar; falla si sigue activo"""
+        try:
+            if not stat.S_ISSOCK(os.stat(self.path).st_mode):
+                return  # No es un socket: bind() informará del error sin borrar nada
+        except FileNotFoundError:
+            return
+
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.path)
+        except ConnectionRefusedError:
+            os.unlink(self.path)  # Nadie escucha: el fichero es de un proceso anterior
+            return
+        finally:
+            probe.close()
+        raise OSError(f"Ya hay un servidor escuchando en '{self.path}'")
+
+    def start(self) -> 'ValidationServer':
+        """Arranca el servidor y el hilo de validación en segundo plano"""
+        self._remove_stale_socket()
+        self._queue = queue.Queue()  # Una cola nueva por arranque: stop() deja la señal de parada
+        self._server = _UnixServer(self.path, _RequestHandler)
+        self._server.validation_server = self
+        self._worker = threading.Thread(target=self._run_worker, daemon=True)
+        self._worker.start()
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Arranca el servidor en el hilo actual"""
+        self.start()
+        self._worker.join()
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.close_connections()
+            self._server.server_close()
+            self._server = None
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+        self._queue.put(None)
+
+class ValidationClient:
+    """Cliente ligero que reutiliza la conexión con el demonio"""
+    def __init__(self, path: str, framed: bool = False, timeout: float = None) -> None:
+        self.path = path
+        self.framed = framed
+        self.timeout = timeout
+        self._socket = None
+        self._stream = None
+        self._next_id = 0
+
+    def _connect(self) -> None:
+        if self._socket is None:
+            connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                connection.settimeout(self.timeout)
+                connection.connect(self.path)
+            except OSError:
+                connection.close()
+                raise
+            self._socket = connection
+            self._stream = connection.makefile('rb')
+
+    def close(self) -> None:
+        if self._socket is not None:
+            self._stream.close()
+            self._socket.close()
+            self._socket = self._stream = None
+
+    def __enter__(self) -> 'ValidationClient':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _request(self, messages: list) -> list:
+        """Envía todas las peticiones seguidas y lee sus respuestas en orden"""
+        for attempt in (0, 1):
+            try:
+                self._connect()
+                self._socket.sendall(b''.join(_encode_message(message, self.framed) for message in messages))
+                return [self._response(message) for message in messages]
+            except (ConnectionError, BrokenPipeError):
+                # Reintentar una vez con una conexión nueva
+                self.close()
+                if attempt:
+                    raise
+            except Exception:
+                # Tiempo agotado o respuesta inesperada: la conexión puede tener respuestas
+                # pendientes de otra petición, así que no se reutiliza
+                self.close()
+                raise
+
+    def _response(self, message: dict) -> dict:
+        """Lee la respuesta de 'message' y comprueba que corresponde a su id"""
+        received = _read_message(self._stream)
+        if received is None:
+            raise ConnectionError("El servidor cerró la conexión")
+
+        response = received[0]
+        if not isinstance(response, dict) or response.get('id') != message['id']:
+            if isinstance(response, dict) and 'error' in response and response.get('id') is None:
+                # Error de protocolo: el servidor responde sin id y cierra la conexión
+                raise ValueError(response['error'].get('message'))
+            raise ValueError(f"Respuesta inesperada para la petición {message['id']}: {response!r}")
+        return response
+
+    def _message(self, schema: str, **content) -> dict:
+        self._next_id += 1
+        return {'id': self._next_id, 'schema': schema, **content}
+
+    def check(self, schema: str, data: dict) -> dict:
+        """Valida un registro con el esquema registrado 'schema'"""
+        return self._request([self._message(schema, data=data)])[0]
+
+    def check_many(self, schema: str, records: list) -> list:
+        """Envía varios registros en una sola petición"""
+        return self._request([self._message(schema, records=records)])[0]['results']
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Demonio local de validación DiSchema")
+    parser.add_argument('socket', help="Ruta del socket Unix")
+    parser.add_argument('schemas', nargs='+', help="Esquemas registrados como nombre=artefacto")
+    arguments = parser.parse_args()
+
+    registry = dict(entry.split('=', 1) for entry in arguments.schemas)
+    ValidationServer(registry, arguments.socket).serve_forever()
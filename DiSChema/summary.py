@@ -0,0 +1,245 @@
+# summary.py - Resumen agregado de calidad de datos para validación por lotes
+from .exceptions import *
+
+# Regla del esquema asociada a cada tipo de error devuelto por las validaciones
+error_rules = {
+    NoFieldError: 'required',
+    InvalidTypeError: 'type',
+    NoEqualError: 'equal',
+    ExcludedValueError: 'excluded-equalities',
+    NotAllowedValueError: 'allowed-equalities',
+    ExcessSizeError: 'max-size',
+    MissingSizeError: 'min-size',
+    ExcessLengthError: 'max-length',
+    MissingLengthError: 'min-length',
+    ExcludedCharactersError: 'excluded-chars',
+    NotAllowedCharacterError: 'allowed-chars',
+    PatternMismatchError: 'pattern',
+    InvalidFormatError: 'format',
+    MagicPrefixError: 'magic-prefix',
+    NotAllowedByteError: 'allowed-bytes',
+    DuplicateValueError: 'unique'
+}
+
+# Claves que se validan recorriendo la estructura, no con el selector del tipo
+_nested_keys = ('schema', 'allowed-items', '_schema-validator', '_allowed-validators')
+
+class ValidationSummary:
+    """Contadores compactos por (ruta, regla) sin conservar objetos de error"""
+    def __init__(self, validator=None, examples: int = 5) -> None:
+        self.validator = validator
+        self.examples = examples
+        self.records = 0
+        self.invalid_records = 0
+        self.failures = {}  # (ruta, regla) -> [conteo, índices de ejemplo]
+        self.fields = {}  # ruta -> estadísticas del campo
+        self._flat_schemes = {}
+
+    def add(self, record, index: int = None) -> bool:
+        """Acumula un registro; devuelve True si es válido"""
+        if self.validator is None:
+            raise ValueError("Se necesita un validador para acumular registros")
+
+        if index is None:
+            index = self.records
+        self.records += 1
+
+        valid = self._walk_fields(self.validator._prepared, record, "", index)
+        if not valid:
+            self.invalid_records += 1
+        return valid
+
+    def consume(self, records, start: int = 0) -> 'ValidationSummary':
+        """Acumula un iterable de registros numerándolos desde 'start'"""
+        for index, record in enumerate(records, start):
+            self.add(record, index)
+        return self
+
+    def merge(self, other) -> 'ValidationSummary':
+        """Combina otro resumen (o su informe) de otro bloque o proceso"""
+        report = other.report() if isinstance(other, ValidationSummary) else other
+
+        self.records += report['records']
+        self.invalid_records += report['invalid_records']
+
+        for path, rules in report['failures'].items():
+            for rule, failure in rules.items():
+                current = self.failures.setdefault((path, rule), [0, []])
+                current[0] += failure['count']
+                current[1] = sorted(set(current[1]) | set(failure['examples']))[:self.examples]
+
+        for path, stats in report['fields'].items():
+            current = self.fields.setdefault(path, self._empty_stats())
+            for key in ('present', 'missing', 'nulls'):
+                current[key] += stats[key]
+            if stats['min'] is not None:
+                current['min'] = stats['min'] if current['min'] is None else min(current['min'], stats['min'])
+            if stats['max'] is not None:
+                current['max'] = stats['max'] if current['max'] is None else max(current['max'], stats['max'])
+
+        return self
+
+    def report(self) -> dict:
+        """Informe serializable (JSON) y combinable con merge()"""
+        failures = {}
+        for (path, rule), (count, examples) in self.failures.items():
+            failures.setdefault(path, {})[rule] = {'count': count, 'examples': list(examples)}
+
+        return {
+            'records': self.records,
+            'invalid_records': self.invalid_records,
+            'failures': failures,
+            'fields': {path: dict(stats) for path, stats in self.fields.items()}
+        }
+
+    @classmethod
+    def from_report(cls, report: dict, examples: int = 5) -> 'ValidationSummary':
+        """Reconstruye un resumen a partir de un informe para seguir combinando"""
+        return cls(examples=examples).merge(report)
+
+    @staticmethod
+    def _empty_stats() -> dict:
+        return {'present': 0, 'missing': 0, 'nulls': 0, 'min': None, 'max': None}
+
+    def _fail(self, path: str, rule: str, index: int) -> None:
+        """Incrementa el contador de (ruta, regla) y guarda el índice si hay hueco"""
+        failure = self.failures.get((path, rule))
+        if failure is None:
+            failure = self.failures[(path, rule)] = [0, []]
+
+        failure[0] += 1
+        examples = failure[1]
+        if len(examples) < self.examples and (not examples or examples[-1] != index):
+            examples.append(index)
+
+    def _flat_scheme(self, scheme: dict) -> dict:
+        """Esquema del campo sin reglas anidadas (se recorren aparte)"""
+        flat = self._flat_schemes.get(id(scheme))
+        if flat is None:
+            flat = {key: value for key, value in scheme.items() if key not in _nested_keys}
+            self._flat_schemes[id(scheme)] = flat
+        return flat
+
+    def _walk_fields(self, prepared: dict, data, prefix: str, index: int) -> bool:
+        """Recorre los campos de un esquema completo"""
+        if not isinstance(data, dict):
+            self._fail(prefix or '$', 'type', index)
+            return False
+
+        valid = True
+        for field, scheme in prepared.items():
+            path = f"{prefix}.{field}" if prefix else field
+            if not self._walk_value(field in data, data.get(field), scheme, path, index):
+                valid = False
+        return valid
+
+    def _walk_value(self, present: bool, value, scheme: dict, path: str, index: int) -> bool:
+        """Aplica las mismas reglas que check() a un valor y cuenta los fallos"""
+        validator = self.validator
+        if not isinstance(scheme, dict) or 'type' not in scheme or 'required' not in scheme:
+            self._fail(path, 'schema', index)
+            return False
+
+        stats = self.fields.get(path)
+        if stats is None:
+            stats = self.fields[path] = self._empty_stats()
+
+        if not present:
+            if scheme['required'] or 'default-value' not in scheme:
+                stats['missing'] += 1
+                if scheme['required']:
+                    self._fail(path, 'required', index)
+                    return False
+                return True
+            value = scheme['default-value']
+
+        stats['present'] += 1
+        if value is None:
+            stats['nulls'] += 1
+
+        expected_type = scheme['type']
+        if not validator._matches_type(value, expected_type):
+            if not scheme.get('try-transformation') or value is None or scheme.get('_type') is None:
+                self._fail(path, 'type', index)
+                return False
+            try:
+                value = scheme['_type'](value)
+            except (ValueError, TypeError):
+                self._fail(path, 'type', index)
+                return False
+
+        # Mínimo/máximo: valor para números, longitud para el resto
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            measure = value
+        elif hasattr(value, '__len__') and not isinstance(value, bool):
+            measure = len(value)
+        else:
+            measure = None
+        if measure is not None:
+            if stats['min'] is None or measure < stats['min']:
+                stats['min'] = measure
+            if stats['max'] is None or measure > stats['max']:
+                stats['max'] = measure
+
+        selector = validator.selectors.get(type(value).__name__)
+        if selector is not None:
+            result = selector(value, self._flat_scheme(scheme), field_path=path)
+            if isinstance(result, Exception):
+                self._fail(path, error_rules.get(type(result), 'other'), index)
+                return False
+
+        if isinstance(value, dict):
+            return self._walk_dict(value, scheme, path, index)
+        if isinstance(value, list):
+            return self._walk_list(value, scheme, path, index)
+        return True
+
+    def _walk_nested(self, value, allowed_schema: dict, sub_validator, path: str, index: int) -> bool:
+        """Recorre un esquema anidado usando el sub-validador preparado"""
+        if 'type' in allowed_schema:
+            return self._walk_value(True, value, sub_validator._prepared['nested_field'], path, index)
+        return self._walk_fields(sub_validator._prepared, value, path, index)
+
+    def _matches_any(self, value, allowed_items: list, sub_validators: list) -> bool:
+        """Comprueba si un valor coincide con algún esquema de 'allowed-items'"""
+        for allowed_schema, sub_validator in zip(allowed_items, sub_validators):
+            if isinstance(allowed_schema, dict):
+                if sub_validator.check({"nested_field": value} if 'type' in allowed_schema else value)['valid']:
+                    return True
+            elif isinstance(allowed_schema, str) and self.validator._matches_type(value, allowed_schema):
+                return True
+        return False
+
+    def _walk_items(self, items, scheme: dict, path: str, index: int) -> bool:
+        """Recorre los elementos de una lista o los valores de un dict con 'allowed-items'"""
+        allowed_items = scheme.get('allowed-items')
+        sub_validators = scheme.get('_allowed-validators')
+        if not isinstance(allowed_items, list) or sub_validators is None:
+            return True
+
+        valid = True
+        # Un único esquema: se recorre en detalle para contar por ruta y regla
+        if len(allowed_items) == 1 and isinstance(allowed_items[0], dict):
+            for item in items:
+                if not self._walk_nested(item, allowed_items[0], sub_validators[0], path, index):
+                    valid = False
+            return valid
+
+        for item in items:
+            if not self._matches_any(item, allowed_items, sub_validators):
+                self._fail(path, 'allowed-items', index)
+                valid = False
+        return valid
+
+    def _walk_list(self, value: list, scheme: dict, path: str, index: int) -> bool:
+        return self._walk_items(value, scheme, f"{path}[*]", index)
+
+    def _walk_dict(self, value: dict, scheme: dict, path: str, index: int) -> bool:
+        valid = True
+        sub_validator = scheme.get('_schema-validator')
+        if sub_validator is not None:
+            valid = self._walk_nested(value, scheme['schema'], sub_validator, path, index)
+
+        if not self._walk_items(value.values(), scheme, f"{path}.*", index):
+            valid = False
+        return valid
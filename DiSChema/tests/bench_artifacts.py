@@ -0,0 +1,46 @@
+import os
+import re
+import string
+import tempfile
+import timeit
+from DiSChema import DiSchema
+from DiSChema.formats import compile_pattern
+
+# Esquema grande: conjuntos de caracteres, patrones distintos y sub-validadores anidados
+def make_scheme(fields: int) -> dict:
+    scheme = {}
+    for index in range(fields):
+        kind = index % 5
+        if kind == 0:
+            scheme[f'f{index}'] = {'type': 'str', 'required': True, 'max-length': 20,
+                                   'allowed-chars': list(string.ascii_letters)}
+        elif kind == 1:
+            scheme[f'f{index}'] = {'type': 'str', 'required': False, 'pattern': f'[a-z]{{{index}}}[0-9]*'}
+        elif kind == 2:
+            scheme[f'f{index}'] = {'type': 'int', 'required': True, 'allowed-equalities': list(range(50))}
+        elif kind == 3:
+            scheme[f'f{index}'] = {'type': 'dict', 'required': False, 'schema': {
+                'a': {'type': 'str', 'required': True},
+                'b': {'type': 'dict', 'required': False, 'schema': {'c': {'type': 'int', 'required': True}}}
+            }}
+        else:
+            scheme[f'f{index}'] = {'type': 'list', 'required': False,
+                                   'allowed-items': [{'x': {'type': 'int', 'required': True}}, 'str']}
+    return scheme
+
+def cold() -> None:
+    # Vacía las cachés de expresiones regulares: ambos caminos parten en frío
+    re.purge()
+    compile_pattern.cache_clear()
+
+scheme = make_scheme(2000)
+rounds = 20
+path = os.path.join(tempfile.mkdtemp(), 'scheme.dsc')
+DiSchema(scheme).save(path)
+
+prepare = min(timeit.repeat(lambda: DiSchema(scheme), setup=cold, number=1, repeat=rounds))
+load = min(timeit.repeat(lambda: DiSchema.load(path), setup=cold, number=1, repeat=rounds))
+
+print(f"preparar: {prepare * 1000:.1f} ms")
+print(f"cargar artefacto: {load * 1000:.1f} ms ({os.path.getsize(path) / 1024:.0f} KiB)")
+print(f"aceleración: {prepare / load:.1f}x")
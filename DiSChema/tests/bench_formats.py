@@ -0,0 +1,38 @@
+import timeit
+from DiSChema import DiSchema
+
+# Aproximación antigua: lista enorme de caracteres permitidos
+scheme_allowed_chars = {
+    'id': {
+        'type': 'str',
+        'required': True,
+        'min-length': 36,
+        'max-length': 36,
+        'allowed-chars': list('0123456789abcdef-')
+    }
+}
+
+scheme_pattern = {
+    'id': {
+        'type': 'str',
+        'required': True,
+        'pattern': '[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}'
+    }
+}
+
+scheme_format = {
+    'id': {'type': 'str', 'required': True, 'format': 'uuid'}
+}
+
+data = {'id': '123e4567-e89b-12d3-a456-426614174000'}
+rounds = 50000
+
+for name, scheme in [
+    ('allowed-chars', scheme_allowed_chars),
+    ('pattern', scheme_pattern),
+    ('format', scheme_format)
+]:
+    validator = DiSchema(scheme)
+    assert validator.check(data)['valid']
+    seconds = timeit.timeit(lambda: validator.check(data), number=rounds)
+    print(f"{name}: {rounds / seconds:,.0f} registros/s")
@@ -0,0 +1,54 @@
+import pytest
+from DiSChema import DiSchema
+from DiSChema.artifacts import ARTIFACT_MAGIC, ARTIFACT_VERSION
+from DiSChema.exceptions import ArtifactError
+
+scheme = {
+    'name': {'type': 'str', 'required': True, 'allowed-chars': list('abc'), 'pattern': '[abc]+'},
+    'age': {'type': 'int', 'required': False, 'min-size': 0},
+    'address': {'type': 'dict', 'required': False, 'schema': {
+        'city': {'type': 'str', 'required': True}
+    }},
+    'tags': {'type': 'list', 'required': False, 'allowed-items': [{'type': 'str', 'required': True}]}
+}
+
+def test_load_validates_like_prepared(tmp_path):
+    path = tmp_path / 'scheme.dsc'
+    validator = DiSchema(scheme)
+    validator.save(path)
+    loaded = DiSchema.load(path)
+
+    records = [
+        {'name': 'abc', 'age': 3, 'address': {'city': 'x'}, 'tags': ['a']},
+        {'name': 'abd'},
+        {'name': 'a', 'address': {}},
+        {'name': 'a', 'tags': [1]}
+    ]
+    for record in records:
+        assert loaded.check(record)['valid'] == validator.check(record)['valid']
+
+def test_loaded_scheme_is_rebuilt_without_private_keys(tmp_path):
+    path = tmp_path / 'scheme.dsc'
+    DiSchema(scheme).save(path)
+    assert DiSchema.load(path).scheme == scheme
+
+def test_state_skips_caches_and_defaults():
+    validator = DiSchema(scheme)
+    validator.check({'name': 'a'})
+    state = validator.__getstate__()
+    assert set(state) == {'_prepared'}
+
+def test_unknown_header_is_rejected(tmp_path):
+    path = tmp_path / 'scheme.dsc'
+    path.write_bytes(b'not an artifact')
+    with pytest.raises(ArtifactError):
+        DiSchema.load(path)
+
+def test_other_version_is_rejected(tmp_path):
+    path = tmp_path / 'scheme.dsc'
+    DiSchema(scheme).save(path)
+    content = path.read_bytes()
+    header = len(ARTIFACT_MAGIC)
+    path.write_bytes(content[:header] + (ARTIFACT_VERSION + 1).to_bytes(2, 'big') + content[header + 2:])
+    with pytest.raises(ArtifactError):
+        DiSchema.load(path)
@@ -0,0 +1,67 @@
+import mmap
+import pytest
+from DiSChema import DiSchema
+from DiSChema.exceptions import (
+    InvalidTypeError, MagicPrefixError, NotAllowedByteError, ExcessLengthError, MissingLengthError
+)
+
+PNG = b'\x89PNG\r\n\x1a\n'
+
+def check(rule: dict, value):
+    return DiSchema({'blob': {'type': 'bytes', 'required': True, **rule}}).check({'blob': value})
+
+@pytest.mark.parametrize('value', [b'abc', bytearray(b'abc'), memoryview(b'abc')])
+def test_buffer_types_are_bytes(value):
+    assert check({'min-length': 3, 'max-length': 3}, value)['valid']
+
+def test_mmap_is_validated_without_copy():
+    buffer = mmap.mmap(-1, 16)
+    buffer.write(PNG)
+    try:
+        result = check({'magic-prefix': PNG, 'max-length': 16}, buffer)
+        assert result['valid']
+        assert result['data']['copy']['blob'] is buffer
+    finally:
+        buffer.close()
+
+def test_length_limits():
+    assert isinstance(check({'max-length': 2}, b'abc')['errors'][0], ExcessLengthError)
+    assert isinstance(check({'min-length': 4}, b'abc')['errors'][0], MissingLengthError)
+
+def test_memoryview_length_counts_bytes():
+    view = memoryview(bytearray(8)).cast('I')
+    assert check({'max-length': 8, 'min-length': 8}, view)['valid']
+
+def test_magic_prefix():
+    assert check({'magic-prefix': PNG}, PNG + b'data')['valid']
+    assert check({'magic-prefix': [b'GIF8', PNG]}, b'GIF89a')['valid']
+    result = check({'magic-prefix': PNG}, b'GIF89a')
+    assert isinstance(result['errors'][0], MagicPrefixError)
+
+def test_invalid_magic_prefix_rule():
+    result = check({'magic-prefix': 'PNG'}, b'PNG')
+    assert not result['valid']
+    assert "'magic-prefix'" in str(result['errors'][0])
+
+def test_allowed_bytes():
+    rule = {'allowed-bytes': b'0123456789abcdef'}
+    assert check(rule, b'deadbeef')['valid']
+    result = check(rule, b'deadbeeg')
+    error = result['errors'][0]
+    assert isinstance(error, NotAllowedByteError)
+    assert (error.byte, error.position) == (ord('g'), 7)
+
+def test_allowed_bytes_as_integers():
+    assert check({'allowed-bytes': [0, 1]}, bytes([0, 1, 1, 0]))['valid']
+    assert not check({'allowed-bytes': [0, 1]}, bytes([0, 2]))['valid']
+
+def test_transformation_encodes_text():
+    result = check({'try-transformation': True}, 'ñ')
+    assert result['valid']
+    assert result['data']['copy']['blob'] == 'ñ'.encode('utf-8')
+
+@pytest.mark.parametrize('value', [10 ** 9, [1, 2, 3], 1.5])
+def test_transformation_rejects_non_buffers(value):
+    result = check({'try-transformation': True}, value)
+    assert not result['valid']
+    assert isinstance(result['errors'][0], InvalidTypeError)
@@ -0,0 +1,31 @@
+from DiSChema import DiSchema
+
+scheme = {
+    'id': {'type': 'int', 'required': True},
+    'nickname': {'type': 'str', 'required': False, 'min-length': 3, 'allowed-chars': list('abc')},
+    'score': {'type': 'int', 'required': False, 'try-transformation': True, 'min-size': 1},
+    'country': {'type': 'str', 'required': False, 'default-value': 'ES'}
+}
+
+def test_absent_optional_fields_are_skipped():
+    result = DiSchema(scheme).check({'id': 1})
+    assert result['valid']
+    assert result['errors'] == []
+    assert 'nickname' not in result['data']['copy']
+    assert 'score' not in result['data']['copy']
+
+def test_absent_optional_field_with_default_is_filled():
+    result = DiSchema(scheme).check({'id': 1})
+    assert result['data']['copy']['country'] == 'ES'
+    assert 'country' not in result['data']['original']
+
+def test_present_optional_fields_are_validated():
+    validator = DiSchema(scheme)
+    assert not validator.check({'id': 1, 'nickname': 'ab'})['valid']
+    assert not validator.check({'id': 1, 'score': '0'})['valid']
+    assert validator.check({'id': 1, 'nickname': 'abc', 'score': '5'})['valid']
+
+def test_missing_required_field_is_reported():
+    result = DiSchema(scheme).check({})
+    assert not result['valid']
+    assert len(result['errors']) == 1
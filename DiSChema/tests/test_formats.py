@@ -0,0 +1,110 @@
+import pytest
+from DiSChema import DiSchema
+from DiSChema.exceptions import PatternMismatchError, InvalidFormatError
+from DiSChema.formats import is_uuid, is_email, is_date, is_datetime, is_ipv4, is_ipv6
+
+def check(rule: dict, value):
+    return DiSchema({'field': {'type': 'str', 'required': True, **rule}}).check({'field': value})
+
+def test_pattern_must_match_whole_value():
+    rule = {'pattern': '[a-z]+[0-9]{2}'}
+    assert check(rule, 'abc12')['valid']
+    result = check(rule, 'abc123')
+    assert not result['valid']
+    assert isinstance(result['errors'][0], PatternMismatchError)
+
+def test_invalid_pattern_is_reported_at_check_time():
+    validator = DiSchema({'field': {'type': 'str', 'required': True, 'pattern': '('}})
+    result = validator.check({'field': 'x'})
+    assert not result['valid']
+    assert "'pattern' inválido" in str(result['errors'][0])
+
+def test_unknown_format_is_reported():
+    result = check({'format': 'colour'}, 'red')
+    assert not result['valid']
+    assert 'no soportado' in str(result['errors'][0])
+
+@pytest.mark.parametrize('value, expected', [
+    ('123e4567-e89b-12d3-a456-426614174000', True),
+    ('123E4567-E89B-12D3-A456-426614174000', True),
+    ('123e4567e89b12d3a456426614174000', False),
+    ('123e4567-e89b-12d3-a456-42661417400g', False),
+    ('123e4567-e89b-12d3-a456_426614174000', False)
+])
+def test_uuid(value, expected):
+    assert is_uuid(value) is expected
+
+@pytest.mark.parametrize('value, expected', [
+    ('user@example.com', True),
+    ('first.last@sub.example.org', True),
+    ('user@localhost', False),
+    ('user example@example.com', False),
+    ('a@b@example.com', False),
+    ('@example.com', False),
+    ('user@example..com', False)
+])
+def test_email(value, expected):
+    assert is_email(value) is expected
+
+@pytest.mark.parametrize('value, expected', [
+    ('2024-01-05', True),
+    ('2024-02-29', True),
+    ('2023-02-29', False),
+    ('2024-W01-1', False),
+    ('2024-001', False),
+    ('20240105', False),
+    ('2024-1-5', False),
+    ('２０２４-01-05', False)
+])
+def test_date(value, expected):
+    assert is_date(value) is expected
+
+@pytest.mark.parametrize('value, expected', [
+    ('2024-01-05T10:20:30', True),
+    ('2024-01-05 10:20', True),
+    ('2024-01-05T10:20:30+02:00', True),
+    ('2024-01-05T10:20:30Z', True),
+    ('2024-01-05', False),
+    ('2024-W01-1T10:20', False),
+    ('2024-01-05T25:00', False)
+])
+def test_datetime(value, expected):
+    assert is_datetime(value) is expected
+
+@pytest.mark.parametrize('value, expected', [
+    ('192.168.0.1', True),
+    ('0.0.0.0', True),
+    ('255.255.255.255', True),
+    ('256.1.1.1', False),
+    ('01.1.1.1', False),
+    ('1.1.1', False),
+    ('1.1.1.1.1', False),
+    ('1.1.1.٣', False)
+])
+def test_ipv4(value, expected):
+    assert is_ipv4(value) is expected
+
+@pytest.mark.parametrize('value, expected', [
+    ('::1', True),
+    ('2001:db8::ff00:42:8329', True),
+    ('2001:0db8:0000:0000:0000:ff00:0042:8329', True),
+    ('2001:db8::g', False),
+    ('1.2.3.4', False),
+    ('2001:db8:::1', False)
+])
+def test_ipv6(value, expected):
+    assert is_ipv6(value) is expected
+
+@pytest.mark.parametrize('name, valid, invalid', [
+    ('uuid', '123e4567-e89b-12d3-a456-426614174000', 'nope'),
+    ('email', 'user@example.com', 'user'),
+    ('date', '2024-01-05', '2024-W01-1'),
+    ('datetime', '2024-01-05T10:20:30', '2024-01-05'),
+    ('ipv4', '10.0.0.1', '10.0.0.256'),
+    ('ipv6', '::1', '1::2::3')
+])
+def test_format_rule(name, valid, invalid):
+    assert check({'format': name}, valid)['valid']
+    result = check({'format': name}, invalid)
+    assert not result['valid']
+    assert isinstance(result['errors'][0], InvalidFormatError)
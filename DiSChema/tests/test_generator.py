@@ -0,0 +1,118 @@
+import json
+import pytest
+from DiSChema import DiSchema
+from DiSChema.generator import SchemaGenerator
+
+scheme = {
+    'id': {'type': 'int', 'required': True, 'min-size': 1, 'max-size': 10 ** 6},
+    'code': {'type': 'str', 'required': True, 'min-length': 4, 'max-length': 8, 'allowed-chars': list('ABC123')},
+    'kind': {'type': 'str', 'required': True, 'allowed-equalities': ['a', 'b', 'c'], 'excluded-equalities': ['c']},
+    'email': {'type': 'str', 'required': False, 'format': 'email'},
+    'debt': {'type': 'float', 'required': False, 'max-size': -1},
+    'level': {'type': 'int', 'required': False, 'max-size': -5},
+    'active': {'type': 'bool', 'required': True},
+    'tags': {'type': 'list', 'required': False, 'unique-items': True, 'min-length': 3, 'max-length': 6,
+             'allowed-items': [{'type': 'int', 'required': True, 'min-size': 0, 'max-size': 9}]},
+    'users': {'type': 'list', 'required': False, 'unique-by': 'name', 'min-length': 2, 'max-length': 4,
+              'allowed-items': [{
+                  'name': {'type': 'str', 'required': True, 'max-length': 2, 'allowed-chars': list('ab')},
+                  'age': {'type': 'int', 'required': True}
+              }]},
+    'address': {'type': 'dict', 'required': False, 'schema': {
+        'city': {'type': 'str', 'required': True, 'min-length': 1},
+        'zip': {'type': 'str', 'required': False, 'pattern': '[0-9]{5}', 'allowed-equalities': ['28001', '08001']}
+    }},
+    'blob': {'type': 'bytes', 'required': False, 'magic-prefix': b'\x89PNG', 'allowed-bytes': b'\x89PNG0123'}
+}
+
+def test_labels_always_match_check():
+    validator = DiSchema(scheme)
+    generator = SchemaGenerator(scheme, seed=7, invalid_rate=0.5)
+    labels = []
+    for record, valid in generator.records(300, labeled=True):
+        assert validator.check(record)['valid'] is valid
+        labels.append(valid)
+    assert True in labels and False in labels
+
+def test_only_mutated_records_are_checked():
+    generator = SchemaGenerator(scheme, seed=5, invalid_rate=0.3)
+    calls = []
+    check = generator.validator.check
+    generator.validator.check = lambda record: calls.append(record) or check(record)
+
+    records = list(generator.records(200, labeled=True))
+    assert 0 < len(calls) < len(records)
+    assert sum(not valid for _, valid in records) <= len(calls)
+
+def test_verify_checks_every_record():
+    generator = SchemaGenerator(scheme, seed=5, verify=True)
+    calls = []
+    check = generator.validator.check
+    generator.validator.check = lambda record: calls.append(record) or check(record)
+    assert len(list(generator.records(20))) == len(calls) == 20
+
+def test_same_seed_same_records():
+    first = list(SchemaGenerator(scheme, seed=3).records(20))
+    second = list(SchemaGenerator(scheme, seed=3).records(20))
+    assert first == second
+
+def test_negative_max_size_without_min_size():
+    generator = SchemaGenerator(scheme, seed=1, optional_rate=1.0)
+    for record in generator.records(50):
+        assert record['debt'] <= -1
+        assert record['level'] <= -5
+
+def test_unique_items_and_unique_by():
+    generator = SchemaGenerator(scheme, seed=2, optional_rate=1.0)
+    for record in generator.records(50):
+        assert len(set(record['tags'])) == len(record['tags'])
+        names = [user['name'] for user in record['users']]
+        assert len(set(names)) == len(names)
+
+def test_pattern_without_fixed_values_is_refused():
+    with pytest.raises(ValueError):
+        SchemaGenerator({'zip': {'type': 'str', 'required': True, 'pattern': '[0-9]{5}'}})
+    with pytest.raises(ValueError):
+        SchemaGenerator({'items': {'type': 'list', 'required': True, 'allowed-items': [
+            {'code': {'type': 'str', 'required': True, 'pattern': 'x+'}}
+        ]}})
+
+def test_impossible_schema_is_refused():
+    impossible = [
+        {'id': {'type': 'int', 'required': True, 'min-size': 5, 'max-size': 1}},
+        {'code': {'type': 'str', 'required': True, 'min-length': 5, 'max-length': 1}},
+        {'kind': {'type': 'str', 'required': True, 'allowed-equalities': ['a'], 'excluded-equalities': ['a']}},
+        {'code': {'type': 'str', 'required': True, 'min-length': 1, 'allowed-chars': ['a'], 'excluded-chars': ['a']}},
+        {'tags': {'type': 'list', 'required': True, 'unique-items': True, 'min-length': 3,
+                  'allowed-items': [{'type': 'bool', 'required': True}]}}
+    ]
+    for schema in impossible:
+        with pytest.raises(ValueError):
+            SchemaGenerator(schema).record()
+
+def test_write_ndjson(tmp_path):
+    path = tmp_path / 'records.ndjson'
+    assert SchemaGenerator(scheme, seed=4).write_ndjson(path, 10, hex_bytes=True) == 10
+    lines = path.read_text(encoding='utf-8').splitlines()
+    assert len(lines) == 10
+    assert all('id' in json.loads(line) for line in lines)
+
+def test_write_ndjson_refuses_bytes_by_default(tmp_path):
+    nested = {'items': {'type': 'list', 'required': True, 'allowed-items': [{'data': {'type': 'bytes', 'required': True}}]}}
+    for schema in (scheme, nested):
+        with pytest.raises(ValueError):
+            SchemaGenerator(schema).write_ndjson(tmp_path / 'records.ndjson', 1)
+
+def test_write_ndjson_labels(tmp_path):
+    text_scheme = {field: rules for field, rules in scheme.items() if field != 'blob'}
+    path = tmp_path / 'records.ndjson'
+    SchemaGenerator(text_scheme, seed=4, invalid_rate=0.5).write_ndjson(path, 50, labeled=True)
+
+    validator = DiSchema(text_scheme)
+    labels = []
+    with open(path, encoding='utf-8') as file:
+        for line in file:
+            entry = json.loads(line)
+            assert validator.check(entry['record'])['valid'] is entry['valid']
+            labels.append(entry['valid'])
+    assert True in labels and False in labels
@@ -0,0 +1,92 @@
+import pytest
+from DiSChema import DiSchema
+from DiSChema.exceptions import ValidationBudgetExceededError
+from DiSChema.limits import ValidationBudget
+
+scheme = {
+    'name': {'type': 'str', 'required': True},
+    'tags': {'type': 'list', 'required': False, 'allowed-items': ['str']},
+    'meta': {'type': 'dict', 'required': False, 'schema': {
+        'note': {'type': 'str', 'required': False}
+    }}
+}
+
+def exceeded(result) -> str:
+    assert not result['valid']
+    error = result['errors'][-1]
+    assert isinstance(error, ValidationBudgetExceededError)
+    return error.limit
+
+def test_within_limits_is_valid():
+    limits = {'max-nodes': 100, 'max-string-bytes': 100, 'max-list-items': 10, 'timeout': 5}
+    validator = DiSchema(scheme, limits=limits)
+    assert validator.check({'name': 'abc', 'tags': ['a', 'b'], 'meta': {'note': 'x'}})['valid']
+
+def test_unknown_limit_is_rejected_at_construction():
+    with pytest.raises(ValueError):
+        DiSchema(scheme, limits={'max_nodes': 3})
+    with pytest.raises(TypeError):
+        DiSchema(scheme, limits=['max-nodes'])
+
+def test_max_nodes():
+    validator = DiSchema(scheme, limits={'max-nodes': 5})
+    assert exceeded(validator.check({'name': 'a', 'meta': {'note': 'b'}})) == 'max-nodes'
+
+def test_copy_is_charged_before_validation():
+    # Un payload enorme en una clave que el esquema no usa se rechaza al copiarlo
+    validator = DiSchema(scheme, limits={'max-nodes': 50})
+    payload = {'name': 'a', 'extra': [{} for _ in range(1000)]}
+    assert exceeded(validator.check(payload)) == 'max-nodes'
+
+def test_nested_copies_are_charged():
+    nested = {'type': 'dict', 'required': True, 'schema': {
+        'inner': {'type': 'dict', 'required': True, 'schema': {'leaf': {'type': 'int', 'required': True}}}
+    }}
+    record = {'outer': {'inner': {'leaf': 1}}}
+    validator = DiSchema({'outer': nested}, limits={'max-nodes': 1000})
+    assert validator.check(record)['valid']
+
+    budget = ValidationBudget({})
+    validator._budget = budget
+    validator.check(record)
+    validator._budget = None
+    # Copia raíz (3 dicts) + copias de los sub-validadores (2 + 1) + campos visitados (3)
+    assert budget.nodes == 9
+
+def test_max_list_items_checked_while_copying():
+    validator = DiSchema(scheme, limits={'max-list-items': 3})
+    assert validator.check({'name': 'a', 'tags': ['a', 'b', 'c']})['valid']
+    assert exceeded(validator.check({'name': 'a', 'unused': list(range(10))})) == 'max-list-items'
+
+def test_max_string_bytes_counts_utf8():
+    validator = DiSchema(scheme, limits={'max-string-bytes': 6})
+    assert validator.check({'name': 'abcdef'})['valid']
+    assert validator.check({'name': 'ñññ'})['valid']
+    assert exceeded(validator.check({'name': 'ññññ'})) == 'max-string-bytes'
+    assert exceeded(validator.check({'name': '€€€'})) == 'max-string-bytes'
+
+def test_max_string_bytes_rejects_long_text_without_encoding():
+    validator = DiSchema(scheme, limits={'max-string-bytes': 10})
+    assert exceeded(validator.check({'name': 'ñ' * 100000})) == 'max-string-bytes'
+
+def test_max_string_bytes_counts_scanned_binary_buffers():
+    blob = {'type': 'bytes', 'required': True, 'allowed-bytes': b'abcde'}
+    validator = DiSchema({'blob': blob}, limits={'max-string-bytes': 4})
+    assert validator.check({'blob': b'abcd'})['valid']
+    assert exceeded(validator.check({'blob': b'abcde'})) == 'max-string-bytes'
+
+def test_unscanned_binary_buffers_are_free():
+    blob = {'type': 'bytes', 'required': True, 'max-length': 10, 'magic-prefix': b'ab'}
+    validator = DiSchema({'blob': blob}, limits={'max-string-bytes': 4})
+    assert validator.check({'blob': b'abcdefgh'})['valid']
+
+def test_timeout():
+    validator = DiSchema(scheme, limits={'timeout': 0})
+    payload = {'name': 'a', 'extra': [[] for _ in range(1000)]}
+    assert exceeded(validator.check(payload)) == 'timeout'
+
+def test_budget_is_per_call():
+    validator = DiSchema(scheme, limits={'max-nodes': 10})
+    for _ in range(5):
+        assert validator.check({'name': 'a'})['valid']
+    assert validator._budget is None
@@ -0,0 +1,69 @@
+import pytest
+from DiSChema.multi import MultiSchema
+
+v1 = {
+    'id': {'type': 'int', 'required': True},
+    'name': {'type': 'str', 'required': True},
+    'age': {'type': 'int', 'required': False, 'default-value': 0}
+}
+v2 = {
+    'id': {'type': 'int', 'required': True},
+    'name': {'type': 'str', 'required': True},
+    'email': {'type': 'str', 'required': True, 'format': 'email'},
+    'age': {'type': 'int', 'required': False, 'default-value': 18}
+}
+v3 = {
+    'id': {'type': 'str', 'required': True, 'try-transformation': True},
+    'name': {'type': 'str', 'required': True}
+}
+
+def test_shared_rules_are_grouped():
+    multi = MultiSchema({'v1': v1, 'v2': v2, 'v3': v3})
+    # id (int), id (str), name, age v1, age v2, email
+    assert len(multi.groups) == 6
+    assert multi.versions['v1'][:2] == multi.versions['v2'][:2]
+
+def test_versions_and_best():
+    multi = MultiSchema({'v1': v1, 'v2': v2})
+    result = multi.check({'id': 1, 'name': 'a'})
+    assert result['valid']
+    assert result['versions'] == ['v1']
+    assert result['best'] == 'v1'
+    assert not result['results']['v2']['valid']
+
+    result = multi.check({'id': 1, 'name': 'a', 'email': 'a@b.co'})
+    assert result['versions'] == ['v1', 'v2']
+    assert result['best'] == 'v2'
+
+def test_best_is_fewest_errors_when_none_match():
+    multi = MultiSchema({'v1': v1, 'v2': v2})
+    result = multi.check({'id': 'x', 'name': 'a'})
+    assert not result['valid']
+    assert result['best'] == 'v1'
+    assert result['errors'] == result['results']['v1']['errors']
+
+def test_each_version_gets_its_defaults():
+    multi = MultiSchema({'v1': v1, 'v2': v2})
+    result = multi.check({'id': 1, 'name': 'a', 'email': 'a@b.co'})
+    assert result['results']['v1']['data']['age'] == 0
+    assert result['results']['v2']['data']['age'] == 18
+    assert result['data']['copy'] == result['results']['v2']['data']
+    assert 'age' not in result['data']['original']
+
+def test_transformation_only_in_its_version():
+    multi = MultiSchema({'v1': v1, 'v3': v3})
+    result = multi.check({'id': 7, 'name': 'a'})
+    assert result['versions'] == ['v1', 'v3']
+    assert result['data']['copy']['id'] == '7'
+    assert result['results']['v1']['data']['id'] == 7
+
+def test_budget_error_stops_all_versions():
+    multi = MultiSchema({'v1': v1, 'v2': v2}, limits={'max-nodes': 2})
+    result = multi.check({'id': 1, 'name': 'a', 'extra': [{}, {}, {}]})
+    assert not result['valid']
+    assert result['best'] is None
+    assert result['errors'][0].limit == 'max-nodes'
+
+def test_unknown_limit_is_rejected_at_construction():
+    with pytest.raises(ValueError):
+        MultiSchema({'v1': v1}, limits={'max_nodes': 2})
@@ -0,0 +1,80 @@
+import pytest
+from DiSChema import DiSchema
+from DiSChema.projection import path_tree, PROJECTION_CACHE_SIZE
+
+scheme = {
+    'id': {'type': 'int', 'required': True},
+    'name': {'type': 'str', 'required': True, 'max-length': 5},
+    'address': {'type': 'dict', 'required': False, 'schema': {
+        'city': {'type': 'str', 'required': True},
+        'zip': {'type': 'str', 'required': True, 'min-length': 5}
+    }},
+    'users': {'type': 'list', 'required': False, 'allowed-items': [{
+        'name': {'type': 'str', 'required': True},
+        'age': {'type': 'int', 'required': True}
+    }]},
+    'meta': {'type': 'dict', 'required': False, 'allowed-items': [{'type': 'int', 'required': True}]}
+}
+
+record = {
+    'id': 'wrong',
+    'name': 'too long',
+    'address': {'city': 'x', 'zip': '1'},
+    'users': [{'name': 'a', 'age': 'old'}],
+    'meta': {'a': 1}
+}
+
+def test_path_tree():
+    assert path_tree(None) is None
+    assert path_tree('users[*].name') == {'users': {'[*]': {'name': True}}}
+    assert path_tree(['address', 'address.city']) == {'address': True}
+
+def test_only_validates_selected_fields():
+    validator = DiSchema(scheme)
+    assert not validator.check(record)['valid']
+    assert validator.check(record, only=['address.city', 'users[*].name', 'meta.*'])['valid']
+    assert not validator.check(record, only=['address.zip'])['valid']
+    assert not validator.check(record, only='users[*].age')['valid']
+
+def test_exclude_skips_fields():
+    validator = DiSchema(scheme)
+    fixed = {**record, 'id': 1, 'name': 'ok'}
+    assert validator.check(fixed, exclude=['address.zip', 'users[*].age'])['valid']
+    assert not validator.check(fixed, exclude=['address.zip'])['valid']
+
+def test_projection_keeps_full_validator_intact():
+    validator = DiSchema(scheme)
+    validator.check(record, only=['address.city'])
+    assert len(validator.check(record)['errors']) > 0
+
+@pytest.mark.parametrize('paths', [
+    'unknown',
+    'address.country',
+    'users[*].email',
+    'name.first',
+    'id[*]',
+    'meta.*.value',
+    'users.name'
+])
+def test_unknown_segments_raise(paths):
+    validator = DiSchema(scheme)
+    with pytest.raises(ValueError):
+        validator.check(record, only=paths)
+    with pytest.raises(ValueError):
+        validator.check(record, exclude=paths)
+
+def test_projection_cache_is_bounded():
+    validator = DiSchema(scheme)
+    paths = ['id', 'name', 'address', 'address.city', 'address.zip', 'users', 'users[*].name', 'meta']
+    for first in paths:
+        for second in paths:
+            validator.check(record, only=[first, second])
+    assert len(validator._projections) == PROJECTION_CACHE_SIZE
+
+def test_projection_after_load(tmp_path):
+    path = tmp_path / 'scheme.dsc'
+    DiSchema(scheme).save(path)
+    loaded = DiSchema.load(path)
+    assert loaded._projection is None
+    assert loaded.check(record, only=['address.city'])['valid']
+    assert not loaded.check(record)['valid']
@@ -0,0 +1,217 @@
+import io
+import json
+import os
+import socket
+import struct
+import tempfile
+import threading
+import time
+import pytest
+from DiSChema import DiSchema, server as server_module
+from DiSChema.server import ValidationServer, ValidationClient, _read_message, _encode_message
+
+scheme = {
+    'id': {'type': 'int', 'required': True},
+    'name': {'type': 'str', 'required': True, 'max-length': 5}
+}
+
+@pytest.fixture
+def path():
+    directory = tempfile.mkdtemp()
+    yield os.path.join(directory, 'dischema.sock')
+
+@pytest.fixture
+def server(path):
+    server = ValidationServer({'user': scheme}, path).start()
+    yield server
+    server.stop()
+
+def raw_exchange(path: str, payload: bytes, responses: int) -> list:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.settimeout(5)
+        connection.connect(path)
+        connection.sendall(payload)
+        stream = connection.makefile('rb')
+        return [_read_message(stream)[0] for _ in range(responses)]
+
+# ====== MARCOS ======
+def test_ndjson_and_framed_roundtrip():
+    for framed in (False, True):
+        message = {'id': 1, 'data': {'name': 'ñ'}}
+        stream = io.BytesIO(_encode_message(message, framed) * 2)
+        assert _read_message(stream) == (message, framed)
+        assert _read_message(stream) == (message, framed)
+        assert _read_message(stream) is None
+
+def test_whitespace_between_messages_is_skipped():
+    stream = io.BytesIO(b'\n\r\n  {"id": 1}\n\n\t' + _encode_message({'id': 2}, True) + b'\n')
+    assert _read_message(stream) == ({'id': 1}, False)
+    assert _read_message(stream) == ({'id': 2}, True)
+    assert _read_message(stream) is None
+
+def test_ndjson_non_object_is_read_as_line():
+    assert _read_message(io.BytesIO(b'[1, 2]\n')) == ([1, 2], False)
+
+def test_truncated_frame_and_oversized_frame():
+    assert _read_message(io.BytesIO(struct.pack('>I', 10) + b'{}')) is None
+    with pytest.raises(ValueError):
+        _read_message(io.BytesIO(b'\x04\x00\x00\x01'))
+
+def test_oversized_ndjson_line(monkeypatch):
+    monkeypatch.setattr(server_module, 'MAX_FRAME_SIZE', 16)
+    assert _read_message(io.BytesIO(b'{"a": "123456"}\n')) == ({'a': '123456'}, False)
+    with pytest.raises(ValueError, match='excede el máximo'):
+        _read_message(io.BytesIO(b'{"a": "' + b'x' * 100 + b'"}\n'))
+    with pytest.raises(ValueError, match='excede el máximo'):
+        _read_message(io.BytesIO(b'{"a": "' + b'x' * 100))
+
+# ====== SERVIDOR ======
+def test_check_and_check_many(server, path):
+    for framed in (False, True):
+        with ValidationClient(path, framed=framed, timeout=5) as client:
+            assert client.check('user', {'id': 1, 'name': 'ana'})['valid']
+            response = client.check('user', {'id': 'x', 'name': 'ana'})
+            assert not response['valid']
+            assert response['errors'][0]['type'] == 'InvalidTypeError'
+
+            results = client.check_many('user', [{'id': 1, 'name': 'a'}, {'id': 2, 'name': 'toolong'}])
+            assert [result['valid'] for result in results] == [True, False]
+
+def test_unknown_schema(server, path):
+    with ValidationClient(path, timeout=5) as client:
+        assert client.check('missing', {})['error']['type'] == 'KeyError'
+
+def test_non_object_messages_are_rejected(server, path):
+    payload = b'[1, 2]\n"text"\n' + _encode_message(42, True) + b'{"id": 3, "schema": "user", "data": {"id": 1, "name": "a"}}\n'
+    responses = raw_exchange(path, payload, 4)
+    assert [response['error']['type'] for response in responses[:3]] == ['TypeError'] * 3
+    assert responses[3] == {'id': 3, 'valid': True, 'errors': []}
+
+def test_unhashable_schema_does_not_stop_worker(server, path):
+    payload = b'{"id": 1, "schema": ["user"], "data": {}}\n{"id": 2, "schema": {"a": 1}}\n'
+    responses = raw_exchange(path, payload, 2)
+    assert all(response['error']['type'] == 'TypeError' for response in responses)
+
+    with ValidationClient(path, timeout=5) as client:
+        assert client.check('user', {'id': 1, 'name': 'a'})['valid']
+
+def test_malformed_records_get_a_response(server, path):
+    responses = raw_exchange(path, b'{"id": 1, "schema": "user", "records": 5}\n', 1)
+    assert responses[0]['id'] == 1
+    assert not responses[0]['valid']
+
+def test_invalid_json_closes_connection(server, path):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.settimeout(5)
+        connection.connect(path)
+        connection.sendall(b'{not json}\n')
+        stream = connection.makefile('rb')
+        assert 'error' in _read_message(stream)[0]
+        assert _read_message(stream) is None
+
+def test_concurrent_clients_are_batched(path):
+    server = ValidationServer({'user': scheme}, path, batch_window=0.05)
+    batches = []
+    next_batch = server._next_batch
+    server._next_batch = lambda: batches.append(next_batch()) or batches[-1]
+    server.start()
+    try:
+        results = {}
+
+        def work(index: int) -> None:
+            with ValidationClient(path, timeout=5) as client:
+                results[index] = client.check('user', {'id': index, 'name': 'x' * (index % 8)})['valid']
+
+        threads = [threading.Thread(target=work, args=(index,)) for index in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == {index: index % 8 <= 5 for index in range(16)}
+        assert any(batch is not None and len(batch) > 1 for batch in batches)
+    finally:
+        server.stop()
+
+def test_batch_respects_max_batch(path):
+    server = ValidationServer({'user': scheme}, path, batch_window=0.01, max_batch=3)
+    for index in range(5):
+        server.submit({'id': index})
+    assert [pending.message['id'] for pending in server._next_batch()] == [0, 1, 2]
+    assert [pending.message['id'] for pending in server._next_batch()] == [3, 4]
+
+def test_default_batch_does_not_wait(path):
+    server = ValidationServer({'user': scheme}, path)
+    for index in range(3):
+        server.submit({'id': index})
+    started = time.monotonic()
+    assert [pending.message['id'] for pending in server._next_batch()] == [0, 1, 2]
+    server.submit({'id': 3})
+    assert [pending.message['id'] for pending in server._next_batch()] == [3]
+    assert time.monotonic() - started < 0.05
+
+# ====== ARRANQUE Y RECONEXIÓN ======
+def test_stale_socket_is_replaced(path):
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(path)
+    stale.close()
+    assert os.path.exists(path)
+
+    server = ValidationServer({'user': scheme}, path).start()
+    try:
+        with ValidationClient(path, timeout=5) as client:
+            assert client.check('user', {'id': 1, 'name': 'a'})['valid']
+    finally:
+        server.stop()
+
+def test_live_socket_is_not_replaced(server, path):
+    with pytest.raises(OSError):
+        ValidationServer({'user': scheme}, path).start()
+
+def test_regular_file_is_not_removed(path):
+    with open(path, 'w') as file:
+        file.write('keep')
+    with pytest.raises(OSError):
+        ValidationServer({'user': scheme}, path).start()
+    with open(path) as file:
+        assert file.read() == 'keep'
+
+def test_client_reconnects_after_restart(path):
+    server = ValidationServer({'user': scheme}, path).start()
+    client = ValidationClient(path, timeout=5)
+    try:
+        assert client.check('user', {'id': 1, 'name': 'a'})['valid']
+        server.stop()
+        server.start()
+        assert client.check('user', {'id': 2, 'name': 'b'})['valid']
+    finally:
+        client.close()
+        server.stop()
+
+class SlowSchema(DiSchema):
+    def check(self, data, **options):
+        if data.get('slow'):
+            time.sleep(0.5)
+        return super().check(data, **options)
+
+def test_timeout_does_not_leak_responses(path):
+    server = ValidationServer({'user': SlowSchema(scheme)}, path).start()
+    client = ValidationClient(path, timeout=0.2)
+    try:
+        with pytest.raises(TimeoutError):
+            client.check('user', {'id': 1, 'name': 'a', 'slow': True})
+        assert client._socket is None
+
+        client.timeout = 5
+        response = client.check('user', {'id': 'x', 'name': 'a'})
+        assert response['id'] == client._next_id
+        assert not response['valid']
+    finally:
+        client.close()
+        server.stop()
+
+def test_response_id_must_match(path):
+    client = ValidationClient(path, timeout=5)
+    client._stream = io.BytesIO(_encode_message({'id': 7, 'valid': True}, False))
+    with pytest.raises(ValueError):
+        client._response({'id': 8})
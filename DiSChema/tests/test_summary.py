@@ -0,0 +1,82 @@
+import json
+from DiSChema import DiSchema
+from DiSChema.summary import ValidationSummary
+
+scheme = {
+    'id': {'type': 'int', 'required': True, 'min-size': 1},
+    'name': {'type': 'str', 'required': True, 'max-length': 5, 'allowed-chars': list('abcdef')},
+    'age': {'type': 'int', 'required': False, 'default-value': 0, 'max-size': 120},
+    'email': {'type': 'str', 'required': False, 'format': 'email'},
+    'address': {'type': 'dict', 'required': False, 'schema': {
+        'city': {'type': 'str', 'required': True}
+    }},
+    'tags': {'type': 'list', 'required': False, 'allowed-items': [{'type': 'str', 'required': True}]}
+}
+
+records = [
+    {'id': 1, 'name': 'abc'},
+    {'id': 0, 'name': 'abc'},
+    {'name': 'abc'},
+    {'id': 2, 'name': 'abcdefa'},
+    {'id': 3, 'name': 'xyz'},
+    {'id': 4, 'name': 'bad', 'age': 200},
+    {'id': 5, 'name': 'cab', 'email': 'no-at'},
+    {'id': 6, 'name': 'fed', 'email': 'a@b.co', 'address': {'city': 'x'}},
+    {'id': 7, 'name': 'dad', 'address': {}},
+    {'id': 8, 'name': 'ace', 'tags': ['a', 1]},
+    {'id': '9', 'name': 'bed'},
+    {'id': 10, 'name': None},
+    {'id': 11, 'name': 'bee', 'tags': ['x', 'y'], 'age': 30}
+]
+
+def test_counts_match_check():
+    validator = DiSchema(scheme)
+    expected = [validator.check(record)['valid'] for record in records]
+    summary = validator.summarize(records)
+
+    assert summary.records == len(records)
+    assert summary.invalid_records == expected.count(False)
+
+def test_failures_per_rule():
+    report = DiSchema(scheme).summarize(records).report()
+    failures = report['failures']
+
+    assert failures['id']['min-size'] == {'count': 1, 'examples': [1]}
+    assert failures['id']['required'] == {'count': 1, 'examples': [2]}
+    assert failures['id']['type'] == {'count': 1, 'examples': [10]}
+    assert failures['name']['max-length']['examples'] == [3]
+    assert failures['name']['allowed-chars']['examples'] == [4]
+    assert failures['name']['type']['examples'] == [11]
+    assert failures['age']['max-size']['examples'] == [5]
+    assert failures['email']['format']['examples'] == [6]
+    assert failures['address.city']['required']['examples'] == [8]
+    assert failures['tags[*]']['type']['examples'] == [9]
+    assert report['fields']['age']['present'] == len(records)
+    json.dumps(report)
+
+def test_examples_are_bounded():
+    summary = DiSchema(scheme).summarize([{'name': 'a'}] * 20, examples=3)
+    assert summary.report()['failures']['id']['required'] == {'count': 20, 'examples': [0, 1, 2]}
+
+def test_merged_chunks_equal_single_pass():
+    validator = DiSchema(scheme)
+    single = validator.summarize(records).report()
+
+    merged = ValidationSummary(validator)
+    for start in range(0, len(records), 4):
+        merged.merge(validator.summarize(records[start:start + 4], start=start))
+    assert merged.report() == single
+
+def test_from_report_chunks_equal_single_pass():
+    validator = DiSchema(scheme)
+    single = validator.summarize(records).report()
+
+    # Informes serializados, como si vinieran de otros procesos
+    reports = [
+        json.loads(json.dumps(validator.summarize(records[start:start + 5], start=start).report()))
+        for start in range(0, len(records), 5)
+    ]
+    combined = ValidationSummary.from_report(reports[0])
+    for report in reports[1:]:
+        combined.merge(report)
+    assert combined.report() == single
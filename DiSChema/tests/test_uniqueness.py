@@ -0,0 +1,141 @@
+import io
+import pytest
+from DiSChema import DiSchema
+from DiSChema.exceptions import DuplicateValueError, InvalidTypeError
+from DiSChema.uniqueness import BloomIndex, ExactIndex, make_index
+
+scheme = {
+    'id': {'type': 'int', 'required': True, 'unique': True},
+    'email': {'type': 'str', 'required': False, 'unique': True},
+    'name': {'type': 'str', 'required': True}
+}
+
+records = [
+    {'id': 1, 'email': 'a@x.io', 'name': 'a'},
+    {'id': 2, 'email': 'b@x.io', 'name': 'b'},
+    {'id': 1, 'email': 'c@x.io', 'name': 'c'},
+    {'id': 3, 'name': 'd'},
+    {'id': 4, 'email': 'b@x.io', 'name': 'e'}
+]
+
+def duplicates(results) -> list:
+    return [
+        [error.field_path for error in result['errors'] if isinstance(error, DuplicateValueError)]
+        for result in results
+    ]
+
+# ====== ENTRE REGISTROS ======
+@pytest.mark.parametrize('mode', ['exact', 'bloom'])
+def test_check_batch_detects_duplicates(mode):
+    results = list(DiSchema(scheme).check_batch(records, unique=mode, capacity=100))
+    assert duplicates(results) == [[], [], ['id'], [], ['email']]
+    assert [result['valid'] for result in results] == [True, True, False, True, False]
+
+def test_check_does_not_apply_unique():
+    validator = DiSchema(scheme)
+    assert all(validator.check(record)['valid'] for record in records)
+
+def test_batches_are_independent():
+    validator = DiSchema(scheme)
+    first = validator.check_batch(records)
+    next(first)
+    # Un check() o un segundo lote mientras el primero sigue abierto no comparten índices
+    assert validator.check(records[0])['valid']
+    second = list(validator.check_batch(records[:1]))
+    assert second[0]['valid']
+    assert duplicates(first) == [[], ['id'], [], ['email']]
+
+def test_unknown_mode():
+    with pytest.raises(ValueError):
+        list(DiSchema(scheme).check_batch(records, unique='fuzzy'))
+
+def test_check_ndjson_reports_malformed_lines():
+    source = io.StringIO(
+        '{"id": 1, "name": "a"}\n'
+        '\n'
+        '{"id": 2, "name": \n'
+        '{"id": 1, "name": "b"}\n'
+    )
+    results = list(DiSchema(scheme).check_ndjson(source))
+    assert [result['valid'] for result in results] == [True, False, False]
+    assert 'línea 3' in str(results[1]['errors'][0])
+    assert isinstance(results[2]['errors'][0], DuplicateValueError)
+
+def test_check_ndjson_from_path(tmp_path):
+    path = tmp_path / 'records.ndjson'
+    path.write_text('{"id": 1, "name": "a"}\n{"id": 1, "name": "b"}\n', encoding='utf-8')
+    results = list(DiSchema(scheme).check_ndjson(path, unique='bloom', capacity=10))
+    assert [result['valid'] for result in results] == [True, False]
+
+# ====== DENTRO DE LISTAS ======
+def list_scheme(**rules) -> dict:
+    return {'items': {'type': 'list', 'required': True, **rules}}
+
+def test_unique_items():
+    validator = DiSchema(list_scheme(**{'unique-items': True}))
+    assert validator.check({'items': [1, 'a', [1], {'a': 1}]})['valid']
+    result = validator.check({'items': [{'a': 1, 'b': 2}, {'b': 2, 'a': 1}]})
+    assert isinstance(result['errors'][0], DuplicateValueError)
+    assert result['errors'][0].field_path == 'items[1]'
+
+def test_unique_by_single_and_multiple_keys():
+    validator = DiSchema(list_scheme(**{'unique-by': 'id'}))
+    assert validator.check({'items': [{'id': 1}, {'id': 2}]})['valid']
+    assert not validator.check({'items': [{'id': 1}, {'id': 1, 'x': 0}]})['valid']
+
+    validator = DiSchema(list_scheme(**{'unique-by': ['id', 'kind']}))
+    assert validator.check({'items': [{'id': 1, 'kind': 'a'}, {'id': 1, 'kind': 'b'}]})['valid']
+    assert not validator.check({'items': [{'id': 1, 'kind': 'a'}, {'id': 1, 'kind': 'a'}]})['valid']
+
+def test_unique_by_skips_items_without_key():
+    validator = DiSchema(list_scheme(**{'unique-by': 'id'}))
+    assert validator.check({'items': [{'x': 1}, {'x': 2}, {'id': None}]})['valid']
+    assert not validator.check({'items': [{'id': None}, {'id': None}]})['valid']
+
+def test_unique_by_rejects_non_dict_items():
+    result = DiSchema(list_scheme(**{'unique-by': 'id'})).check({'items': [{'id': 1}, 5]})
+    assert isinstance(result['errors'][0], InvalidTypeError)
+    assert result['errors'][0].field_name == 'items[1]'
+
+def test_unique_items_compares_numbers_like_json():
+    validator = DiSchema(list_scheme(**{'unique-items': True}))
+    assert not validator.check({'items': [1, 1.0]})['valid']
+    assert not validator.check({'items': [{'a': [2]}, {'a': [2.0]}]})['valid']
+    assert validator.check({'items': [1, True, 1.5, 'a']})['valid']
+    assert validator.check({'items': [0, False]})['valid']
+
+# ====== ÍNDICES ======
+def test_exact_index():
+    index = make_index('exact')
+    assert isinstance(index, ExactIndex)
+    assert not index.add('a')
+    assert index.add('a')
+    assert not index.add(b'a')
+    assert index.add({'x': [1, 2]}) is False
+    assert index.add({'x': [1, 2]}) is True
+    assert len(index) == 3
+
+@pytest.mark.parametrize('mode', ['exact', 'bloom'])
+def test_index_normalizes_numbers(mode):
+    index = make_index(mode, capacity=100)
+    assert not index.add(1)
+    assert index.add(1.0)
+    assert not index.add(True)
+    assert index.add(True)
+    assert not index.add(-0.0) and index.add(0)
+    assert not index.add({1.0: 'x'}) and index.add({1: 'x'})
+
+def test_bloom_index_has_no_false_negatives():
+    index = BloomIndex(capacity=2000, error_rate=0.01)
+    for value in range(1000):
+        index.add(value)
+    assert all(index.add(value) for value in range(1000))
+    # add() también inserta: la carga final (2000 claves) no supera la capacidad
+    false_positives = sum(index.add(value) for value in range(1000, 2000))
+    assert false_positives < 50
+
+def test_bloom_index_arguments():
+    with pytest.raises(ValueError):
+        BloomIndex(0)
+    with pytest.raises(ValueError):
+        BloomIndex(10, error_rate=1)
@@ -0,0 +1,92 @@
+# uniqueness.py - Índices para reglas de unicidad dentro de listas y entre registros
+import math
+from hashlib import blake2b
+
+def freeze(value):
+    """Clave hashable e independiente del orden de los diccionarios
+
+    Los números se comparan como en JSON: 1 y 1.0 son la misma clave, pero
+    True no es 1 (los booleanos llevan su propia etiqueta).
+    """
+    if isinstance(value, bool):
+        return ('bool', value)
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, dict):
+        return ('dict', tuple(sorted(((repr(freeze(key)), freeze(item)) for key, item in value.items()))))
+    if isinstance(value, (list, tuple)):
+        return ('list', tuple(freeze(item) for item in value))
+    if isinstance(value, (set, frozenset)):
+        return ('set', tuple(sorted(repr(freeze(item)) for item in value)))
+    if isinstance(value, (bytearray, memoryview)):
+        return bytes(value)
+    return value
+
+def key_digest(value) -> bytes:
+    """Resumen de 16 bytes de un valor: memoria constante por clave"""
+    if isinstance(value, str):
+        data = b's' + value.encode('utf-8', 'surrogatepass')
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        data = b'b' + bytes(value)
+    else:
+        data = b'r' + repr(freeze(value)).encode('utf-8', 'surrogatepass')
+    return blake2b(data, digest_size=16).digest()
+
+class ExactIndex:
+    """Conjunto de resúmenes de claves: sin falsos positivos en la práctica"""
+    def __init__(self) -> None:
+        self._seen = set()
+
+    def add(self, value) -> bool:
+        """Registra la clave; devuelve True si ya se había visto"""
+        digest = key_digest(value)
+        if digest in self._seen:
+            return True
+        self._seen.add(digest)
+        return False
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+class BloomIndex:
+    """Filtro de Bloom de memoria acotada con tasa de falsos positivos configurable"""
+    def __init__(self, capacity: int, error_rate: float = 0.001) -> None:
+        if capacity <= 0 or not 0 < error_rate < 1:
+            raise ValueError("'capacity' debe ser positiva y 'error_rate' estar entre 0 y 1")
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self._count = 0
+
+    def add(self, value) -> bool:
+        """Registra la clave; devuelve True si probablemente ya se había visto"""
+        digest = key_digest(value)
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+
+        bits = self._bits
+        seen = True
+        for index in range(self.hashes):
+            position = (first + index * second) % self.size
+            byte, mask = position >> 3, 1 << (position & 7)
+            if not bits[byte] & mask:
+                seen = False
+                bits[byte] |= mask
+
+        if not seen:
+            self._count += 1
+        return seen
+
+    def __len__(self) -> int:
+        return self._count
+
+def make_index(mode: str, capacity: int = 1_000_000, error_rate: float = 0.001):
+    """Crea el índice de unicidad para el modo 'exact' o 'bloom'"""
+    if mode == 'exact':
+        return ExactIndex()
+    if mode == 'bloom':
+        return BloomIndex(capacity, error_rate)
+    raise ValueError(f"Modo de unicidad '{mode}' no soportado (use 'exact' o 'bloom')")